@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Chotto Voice - Voice input assistant application."""
+import logging
 import sys
 from PyQt6.QtWidgets import QApplication
 
@@ -10,6 +11,7 @@ from src.ai_client import create_ai_client
 from src.hotkey import HotkeyConfig
 from src.user_config import UserConfig
 from src.ui.main_window import MainWindow, FirstRunSetupDialog
+from src.ui.style import APP_QSS, create_app_palette
 
 
 def create_transcriber_from_config(user_config, settings):
@@ -86,6 +88,8 @@ def create_ai_client_from_config(user_config, settings):
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Load settings
     settings = get_settings()
     
@@ -101,11 +105,8 @@ def main():
         setup_dialog = FirstRunSetupDialog(user_config)
         result = setup_dialog.exec()
         
-        # Mark first run as complete
+        # Mark first run as complete (the dialog updated this config in place)
         user_config.update(first_run_complete=True)
-        
-        # Reload config after setup
-        user_config = UserConfig.load()
     
     # Create components
     recorder = AudioRecorder(
@@ -124,6 +125,8 @@ def main():
         hold_threshold=user_config.hotkey_hold_threshold
     )
     
+    app.setPalette(create_app_palette())
+    app.setStyleSheet(APP_QSS)
     window = MainWindow(recorder, transcriber, ai_client, hotkey_config, user_config)
     
     sys.exit(app.exec())
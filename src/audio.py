@@ -10,11 +10,14 @@ import sounddevice as sd
 class AudioRecorder:
     """Records audio from the microphone."""
     
+    # Multiplier mapping mean sample amplitude to a 0-100 level
+    LEVEL_SCALE = 1000
+    
     def __init__(
         self,
         sample_rate: int = 16000,
         channels: int = 1,
-        on_audio_level: Optional[Callable[[float], None]] = None
+        on_audio_level: Optional[Callable[[int], None]] = None
     ):
         self.sample_rate = sample_rate
         self.channels = channels
@@ -34,10 +37,10 @@ class AudioRecorder:
             if self._recording:
                 self._frames.append(indata.copy())
                 
-                # Calculate audio level for visualization
+                # Calculate audio level for visualization (scaled to 0-100)
                 if self.on_audio_level:
-                    level = np.abs(indata).mean()
-                    self.on_audio_level(float(level))
+                    level = np.abs(indata).mean() * self.LEVEL_SCALE
+                    self.on_audio_level(min(int(level), 100))
     
     def start_recording(self):
         """Start recording audio."""
@@ -53,8 +56,12 @@ class AudioRecorder:
         )
         self._stream.start()
     
-    def stop_recording(self) -> bytes:
-        """Stop recording and return audio as WAV bytes."""
+    def stop_recording(self) -> memoryview:
+        """Stop recording and return audio as a WAV buffer.
+        
+        The returned memoryview wraps the in-memory WAV data directly,
+        so the (potentially multi-MB) buffer is never copied.
+        """
         with self._lock:
             self._recording = False
         
@@ -66,7 +73,7 @@ class AudioRecorder:
         # Convert frames to WAV
         with self._lock:
             if not self._frames:
-                return b""
+                return memoryview(b"")
             
             audio_data = np.concatenate(self._frames, axis=0)
         
@@ -81,7 +88,7 @@ class AudioRecorder:
             wav_file.setframerate(self.sample_rate)
             wav_file.writeframes(audio_int16.tobytes())
         
-        return wav_buffer.getvalue()
+        return wav_buffer.getbuffer()
     
     def get_audio_level(self) -> float:
         """Get the average audio level of recorded frames (0.0-1.0)."""
@@ -109,15 +116,18 @@ class AudioRecorder:
             wav_buffer = io.BytesIO(wav_bytes)
             with wave.open(wav_buffer, "rb") as wav_file:
                 frames = wav_file.readframes(wav_file.getnframes())
-                audio_data = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32767
+                # One float copy of the samples; thresholds are scaled to the
+                # int16 range instead of normalizing the whole buffer
+                audio_data = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+                level = threshold * 32767
                 
-                # Check average amplitude
-                avg_level = np.abs(audio_data).mean()
+                # Check if there's variation (not just constant noise)
+                std_level = audio_data.std()
                 
-                # Also check if there's variation (not just constant noise)
-                std_level = np.std(audio_data)
+                # Check average amplitude (abs in place, std is already taken)
+                avg_level = np.abs(audio_data, out=audio_data).mean()
                 
-                return avg_level > threshold and std_level > threshold * 0.5
+                return avg_level > level and std_level > level * 0.5
         except Exception:
             return True  # If we can't check, assume it's valid
     
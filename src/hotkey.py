@@ -52,6 +52,7 @@ class HotkeyManager:
         self._key_held = False
         self._hold_timer: Optional[threading.Timer] = None
         self._registered = False
+        self._suppressed = False  # Hooks stay installed but events are ignored
         self._lock = threading.Lock()
     
     def start(self):
@@ -97,6 +98,8 @@ class HotkeyManager:
         debug_print(f"[Hotkey] Setting up single modifier hotkey: '{target_key}'")
         
         def on_event(event):
+            if self._suppressed:
+                return
             event_key = normalize_key(event.name)
             
             if event_key == target_key:
@@ -158,6 +161,8 @@ class HotkeyManager:
     
     def _on_hotkey_pressed(self):
         """Handle full hotkey combo press - toggle recording."""
+        if self._suppressed:
+            return
         with self._lock:
             current_time = time.time()
             
@@ -185,6 +190,14 @@ class HotkeyManager:
         keyboard.unhook_all()
         self._registered = False
     
+    def pause(self):
+        """Ignore hotkey events without removing the keyboard hooks."""
+        self._suppressed = True
+    
+    def resume(self):
+        """Resume handling hotkey events after pause()."""
+        self._suppressed = False
+    
     def _get_trigger_key(self) -> str:
         """Get the trigger key from hotkey combo."""
         # For combo like "ctrl+shift+space", we track "space" 
@@ -238,15 +251,26 @@ class HotkeyManager:
             self.on_record_stop()
     
     def update_hotkey(self, new_key: str):
-        """Update the hotkey."""
-        was_registered = self._registered
-        if was_registered:
-            self.stop()
+        """Update the hotkey.
         
-        self.config.key = new_key
-        
-        if was_registered:
-            self.start()
+        Hotkey events are ignored via pause() while the hooks are swapped,
+        which covers both the combo and single-modifier listeners without
+        blocking the keyboard hook thread.
+        """
+        was_suppressed = self._suppressed
+        self.pause()
+        try:
+            was_registered = self._registered
+            if was_registered:
+                self.stop()
+            
+            self.config.key = new_key
+            
+            if was_registered:
+                self.start()
+        finally:
+            if not was_suppressed:  # A caller-held pause stays in effect
+                self.resume()
     
     def set_recording_state(self, is_recording: bool):
         """Set recording state (called from UI when recording starts/stops)."""
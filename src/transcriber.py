@@ -1,14 +1,18 @@
 """Speech-to-text transcription module for Chotto Voice."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Union
 import openai
 
 
+# WAV data as produced by AudioRecorder.stop_recording()
+AudioData = Union[bytes, memoryview]
+
+
 class Transcriber(ABC):
     """Abstract base class for speech-to-text transcription."""
     
     @abstractmethod
-    def transcribe(self, audio_data: bytes) -> str:
+    def transcribe(self, audio_data: AudioData) -> str:
         """Transcribe audio data to text."""
         pass
 
@@ -20,7 +24,7 @@ class OpenAIWhisperTranscriber(Transcriber):
         self.client = openai.OpenAI(api_key=api_key)
         self.model = model
     
-    def transcribe(self, audio_data: bytes) -> str:
+    def transcribe(self, audio_data: AudioData) -> str:
         """Transcribe audio using OpenAI Whisper API."""
         if not audio_data:
             return ""
@@ -52,7 +56,7 @@ class LocalWhisperTranscriber(Transcriber):
             import whisper
             self._model = whisper.load_model(self.model_name)
     
-    def transcribe(self, audio_data: bytes) -> str:
+    def transcribe(self, audio_data: AudioData) -> str:
         """Transcribe audio using local Whisper model."""
         if not audio_data:
             return ""
@@ -1,8 +1,11 @@
 """Generate application icon for system tray."""
+from functools import lru_cache
+
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QBrush, QPen
 from PyQt6.QtCore import Qt, QRect
 
 
+@lru_cache(maxsize=None)
 def create_tray_icon(size: int = 32) -> QIcon:
     """Create a simple tray icon."""
     pixmap = QPixmap(size, size)
@@ -29,6 +32,7 @@ def create_tray_icon(size: int = 32) -> QIcon:
     return QIcon(pixmap)
 
 
+@lru_cache(maxsize=None)
 def create_recording_icon(size: int = 32) -> QIcon:
     """Create icon for recording state."""
     pixmap = QPixmap(size, size)
@@ -55,6 +59,7 @@ def create_recording_icon(size: int = 32) -> QIcon:
     return QIcon(pixmap)
 
 
+@lru_cache(maxsize=None)
 def create_processing_icon(size: int = 32) -> QIcon:
     """Create icon for processing state."""
     pixmap = QPixmap(size, size)
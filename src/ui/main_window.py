@@ -1,36 +1,115 @@
 """Main window for Chotto Voice."""
+import logging
+from collections import deque
+from functools import lru_cache, partial
 from typing import Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QTextEdit, QLabel, QProgressBar,
+    QPushButton, QPlainTextEdit, QLabel, QProgressBar,
     QSystemTrayIcon, QMenu, QComboBox, QGroupBox,
     QDialog, QFormLayout, QLineEdit, QDialogButtonBox,
     QCheckBox, QMessageBox, QFrame, QListWidget, QListWidgetItem,
-    QStackedWidget, QScrollArea
+    QStackedWidget, QScrollArea, QGridLayout, QButtonGroup, QApplication
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon, QAction, QCloseEvent, QKeyEvent
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QTimer, QSignalBlocker,
+    pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QIcon, QAction, QCloseEvent, QCursor, QKeyEvent, QTextCursor
 
 import sys
+import time
 
 from ..audio import AudioRecorder
-from ..transcriber import Transcriber
-from ..ai_client import AIClient
+from ..transcriber import Transcriber, create_transcriber
+from ..ai_client import AIClient, create_ai_client
 from ..hotkey import HotkeyManager, HotkeyConfig, HOTKEY_PRESETS
 from ..audio_control import get_audio_controller, AudioController
 from ..text_input import type_to_focused_field
-from ..user_config import UserConfig, is_startup_enabled, set_startup_enabled
+from ..user_config import UserConfig, set_startup_enabled
 from .icon import create_tray_icon, create_recording_icon, create_processing_icon
 from .overlay import OverlayIndicator
 
 
+logger = logging.getLogger(__name__)
+
+# Tray notification title, icons and fixed messages
+_TRAY_TITLE = "Chotto Voice"
+_MSG_INFO = QSystemTrayIcon.MessageIcon.Information
+_MSG_WARN = QSystemTrayIcon.MessageIcon.Warning
+_TRAY_MSG_API_SAVED = "APIキーを保存しました。"
+_TRAY_MSG_STARTUP_FAIL = "スタートアップ設定に失敗しました"
+_TRAY_MSG_MINIMIZED = "システムトレイで動作中"
+
+# Hotkey presets as (label, key) pairs, in display order
+_PRESET_ITEMS = tuple(HOTKEY_PRESETS.items())
+
+# Overlay position grid as (key, row, col); the index is the button id
+_POSITIONS = (
+    ("top-left", 0, 0),
+    ("top-center", 0, 1),
+    ("top-right", 0, 2),
+    ("bottom-left", 1, 0),
+    ("bottom-center", 1, 1),
+    ("bottom-right", 1, 2),
+)
+
+# Japanese labels for overlay positions
+_POS_LABELS = {
+    "top-left": "左上",
+    "top-center": "上中央",
+    "top-right": "右上",
+    "bottom-left": "左下",
+    "bottom-center": "下中央",
+    "bottom-right": "右下",
+}
+
+# Inline hotkey presets on the settings page as (label, key) pairs
+_INLINE_PRESETS = (
+    ("右Ctrl", "right ctrl"),
+    ("右Shift", "right shift"),
+    ("右Alt", "right alt"),
+    ("F9", "f9"),
+)
+
+# Prefix for the current-hotkey label
+_HOTKEY_LABEL_PREFIX = "⌨️ ホットキー: "
+
+# Widget enum members used in several places
+_ECHO_PASSWORD = QLineEdit.EchoMode.Password
+_DIALOG_ACCEPTED = QDialog.DialogCode.Accepted
+
+# Sentinel for config attributes that do not exist
+_UNSET = object()
+
+# Keyboard modifier bits as plain ints (resolved once at import)
+_MOD_CTRL = Qt.KeyboardModifier.ControlModifier.value
+_MOD_SHIFT = Qt.KeyboardModifier.ShiftModifier.value
+_MOD_ALT = Qt.KeyboardModifier.AltModifier.value
+_MOD_META = Qt.KeyboardModifier.MetaModifier.value
+
+
+@lru_cache(maxsize=1)
+def _hand_cursor() -> QCursor:
+    """Shared pointing-hand cursor (created on first use, after QApplication)."""
+    return QCursor(Qt.CursorShape.PointingHandCursor)
+
+
+def _make_hand_button(text: str, object_name: str) -> QPushButton:
+    """Create a push button with the given objectName and the hand cursor."""
+    btn = QPushButton(text)
+    btn.setObjectName(object_name)
+    btn.setCursor(_hand_cursor())
+    return btn
+
+
 class HotkeyCapture(QLineEdit):
     """Line edit that captures key combinations."""
     
     hotkey_captured = pyqtSignal(str)
     
-    # Style constants for visibility
-    STYLE_NORMAL = """
+    # One stylesheet for all capture states, selected by the "state" property
+    STYLE = """
         QLineEdit {
             background-color: #2d2d2d;
             color: #ffffff;
@@ -39,118 +118,119 @@ class HotkeyCapture(QLineEdit):
             padding: 6px;
             font-size: 14px;
         }
-    """
-    STYLE_CAPTURING = """
-        QLineEdit {
+        QLineEdit[state="capturing"] {
             background-color: #3d3522;
-            color: #ffffff;
             border: 2px solid #ffc107;
-            border-radius: 4px;
-            padding: 6px;
-            font-size: 14px;
         }
-    """
-    STYLE_SUCCESS = """
-        QLineEdit {
+        QLineEdit[state="success"] {
             background-color: #1e3d1e;
-            color: #ffffff;
             border: 2px solid #28a745;
-            border-radius: 4px;
-            padding: 6px;
-            font-size: 14px;
         }
     """
     
+    # Qt key code (plain int) -> key name
+    _KEY_MAP = {int(k): v for k, v in {
+        Qt.Key.Key_Space: "space",
+        Qt.Key.Key_Return: "enter",
+        Qt.Key.Key_Enter: "enter",
+        Qt.Key.Key_Tab: "tab",
+        Qt.Key.Key_Escape: "esc",
+        Qt.Key.Key_Backspace: "backspace",
+        Qt.Key.Key_Delete: "delete",
+        Qt.Key.Key_Insert: "insert",
+        Qt.Key.Key_Home: "home",
+        Qt.Key.Key_End: "end",
+        Qt.Key.Key_PageUp: "pageup",
+        Qt.Key.Key_PageDown: "pagedown",
+        Qt.Key.Key_Up: "up",
+        Qt.Key.Key_Down: "down",
+        Qt.Key.Key_Left: "left",
+        Qt.Key.Key_Right: "right",
+        Qt.Key.Key_F1: "f1", Qt.Key.Key_F2: "f2", Qt.Key.Key_F3: "f3",
+        Qt.Key.Key_F4: "f4", Qt.Key.Key_F5: "f5", Qt.Key.Key_F6: "f6",
+        Qt.Key.Key_F7: "f7", Qt.Key.Key_F8: "f8", Qt.Key.Key_F9: "f9",
+        Qt.Key.Key_F10: "f10", Qt.Key.Key_F11: "f11", Qt.Key.Key_F12: "f12",
+        Qt.Key.Key_Control: "ctrl",
+        Qt.Key.Key_Shift: "shift",
+        Qt.Key.Key_Alt: "alt",
+        Qt.Key.Key_Meta: "win",
+        Qt.Key.Key_QuoteLeft: "`",
+    }.items()}
+    
+    # (modifier bitmask, name) pairs in hotkey order
+    _MOD_TABLE = (
+        (_MOD_CTRL, "ctrl"),
+        (_MOD_SHIFT, "shift"),
+        (_MOD_ALT, "alt"),
+        (_MOD_META, "win"),
+    )
+    
+    # Key names that are modifiers on their own
+    _MOD_KEYS = frozenset(("ctrl", "shift", "alt", "win", "control", "meta"))
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setPlaceholderText("クリックしてキーを押す...")
         self.setReadOnly(True)
         self._capturing = False
-        self._modifiers = set()
-        self.setStyleSheet(self.STYLE_NORMAL)
+        self.setProperty("state", "normal")
+        self.setStyleSheet(self.STYLE)
+    
+    def set_state(self, state: str):
+        """Switch the capture style ("normal", "capturing" or "success")."""
+        if self.property("state") == state:
+            return
+        self.setProperty("state", state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
     
     def focusInEvent(self, event):
         """Start capturing when focused."""
         super().focusInEvent(event)
         self._capturing = True
-        self._modifiers = set()
         self.setText("")
-        self.setStyleSheet(self.STYLE_CAPTURING)
+        self.set_state("capturing")
         self.setPlaceholderText("キーを押してください...")
     
     def focusOutEvent(self, event):
         """Stop capturing when focus lost."""
         super().focusOutEvent(event)
         self._capturing = False
-        self.setStyleSheet(self.STYLE_NORMAL)
+        self.set_state("normal")
         if not self.text():
             self.setPlaceholderText("クリックしてキーを押す...")
     
     def keyPressEvent(self, event: QKeyEvent):
         """Capture key press."""
-        if not self._capturing:
+        if not self._capturing or event.isAutoRepeat():
             return
         
-        key = event.key()
-        modifiers = event.modifiers()
+        # Modifier-only presses (held before the real key) end here
+        key_name = self._get_key_name(event.key())
+        if not key_name or key_name in self._MOD_KEYS:
+            return
         
         # Build key string
-        parts = []
-        
-        if modifiers & Qt.KeyboardModifier.ControlModifier:
-            parts.append("ctrl")
-        if modifiers & Qt.KeyboardModifier.ShiftModifier:
-            parts.append("shift")
-        if modifiers & Qt.KeyboardModifier.AltModifier:
-            parts.append("alt")
-        if modifiers & Qt.KeyboardModifier.MetaModifier:
-            parts.append("win")
-        
-        # Get the actual key
-        key_name = self._get_key_name(key)
-        if key_name and key_name not in ("ctrl", "shift", "alt", "win", "control", "meta"):
-            parts.append(key_name)
-            
-            # Complete capture
-            hotkey = "+".join(parts)
-            self.setText(hotkey)
-            self.hotkey_captured.emit(hotkey)
-            self._capturing = False
-            self.setStyleSheet(self.STYLE_SUCCESS)
-            self.clearFocus()
-    
-    def _get_key_name(self, key: int) -> str:
-        """Convert Qt key code to key name."""
-        key_map = {
-            Qt.Key.Key_Space: "space",
-            Qt.Key.Key_Return: "enter",
-            Qt.Key.Key_Enter: "enter",
-            Qt.Key.Key_Tab: "tab",
-            Qt.Key.Key_Escape: "esc",
-            Qt.Key.Key_Backspace: "backspace",
-            Qt.Key.Key_Delete: "delete",
-            Qt.Key.Key_Insert: "insert",
-            Qt.Key.Key_Home: "home",
-            Qt.Key.Key_End: "end",
-            Qt.Key.Key_PageUp: "pageup",
-            Qt.Key.Key_PageDown: "pagedown",
-            Qt.Key.Key_Up: "up",
-            Qt.Key.Key_Down: "down",
-            Qt.Key.Key_Left: "left",
-            Qt.Key.Key_Right: "right",
-            Qt.Key.Key_F1: "f1", Qt.Key.Key_F2: "f2", Qt.Key.Key_F3: "f3",
-            Qt.Key.Key_F4: "f4", Qt.Key.Key_F5: "f5", Qt.Key.Key_F6: "f6",
-            Qt.Key.Key_F7: "f7", Qt.Key.Key_F8: "f8", Qt.Key.Key_F9: "f9",
-            Qt.Key.Key_F10: "f10", Qt.Key.Key_F11: "f11", Qt.Key.Key_F12: "f12",
-            Qt.Key.Key_Control: "ctrl",
-            Qt.Key.Key_Shift: "shift",
-            Qt.Key.Key_Alt: "alt",
-            Qt.Key.Key_Meta: "win",
-            Qt.Key.Key_QuoteLeft: "`",
-        }
-        
-        if key in key_map:
-            return key_map[key]
+        modifiers = event.modifiers().value
+        parts = [name for mask, name in self._MOD_TABLE if modifiers & mask]
+        parts.append(key_name)
+        
+        # Complete capture
+        hotkey = "+".join(parts)
+        self.setText(hotkey)
+        self.hotkey_captured.emit(hotkey)
+        self._capturing = False
+        self.set_state("success")
+        self.clearFocus()
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_key_name(key: int) -> str:
+        """Convert Qt key code to key name (memoized per key code)."""
+        name = HotkeyCapture._KEY_MAP.get(key)
+        if name:
+            return name
         
         # Try to get character
         if 32 <= key <= 126:
@@ -159,6 +239,16 @@ class HotkeyCapture(QLineEdit):
         return ""
 
 
+class LatchedCheckBox(QCheckBox):
+    """Checkbox whose state can be set without emitting toggled."""
+    
+    def setCheckedSilently(self, checked: bool):
+        """Set the checked state without notifying connected slots."""
+        if self.isChecked() != checked:
+            with QSignalBlocker(self):
+                self.setChecked(checked)
+
+
 class HotkeySettingsDialog(QDialog):
     """Dialog for configuring hotkey settings."""
     
@@ -188,21 +278,14 @@ class HotkeySettingsDialog(QDialog):
         preset_group = QGroupBox("プリセット")
         preset_layout = QVBoxLayout(preset_group)
         
-        # First row
-        row1 = QHBoxLayout()
-        for name, key in list(HOTKEY_PRESETS.items())[:3]:
+        # Three presets per row
+        rows = (QHBoxLayout(), QHBoxLayout())
+        for i, (name, key) in enumerate(_PRESET_ITEMS):
             btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, k=key: self._set_preset(k))
-            row1.addWidget(btn)
-        preset_layout.addLayout(row1)
-        
-        # Second row
-        row2 = QHBoxLayout()
-        for name, key in list(HOTKEY_PRESETS.items())[3:]:
-            btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, k=key: self._set_preset(k))
-            row2.addWidget(btn)
-        preset_layout.addLayout(row2)
+            btn.clicked.connect(partial(self._set_preset, key))
+            rows[0 if i < 3 else 1].addWidget(btn)
+        for row in rows:
+            preset_layout.addLayout(row)
         
         layout.addWidget(preset_group)
         
@@ -235,7 +318,7 @@ class HotkeySettingsDialog(QDialog):
         """Set a preset hotkey."""
         self.hotkey_input.setText(key)
         self._captured_hotkey = key
-        self.hotkey_input.setStyleSheet(HotkeyCapture.STYLE_SUCCESS)
+        self.hotkey_input.set_state("success")
     
     def get_hotkey(self) -> str:
         return self._captured_hotkey or self.hotkey_input.text()
@@ -322,7 +405,6 @@ class FirstRunSetupDialog(QDialog):
         super().__init__(parent)
         self.user_config = user_config
         self.setWindowTitle("Chotto Voice")
-        self.setFixedSize(440, 480)
         self.setModal(True)
         self.setStyleSheet(self.STYLE)
         
@@ -347,7 +429,7 @@ class FirstRunSetupDialog(QDialog):
         layout.addWidget(gemini_section)
         
         self.gemini_key_input = QLineEdit()
-        self.gemini_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.gemini_key_input.setEchoMode(_ECHO_PASSWORD)
         self.gemini_key_input.setPlaceholderText("APIキーを入力")
         layout.addWidget(self.gemini_key_input)
         
@@ -356,10 +438,8 @@ class FirstRunSetupDialog(QDialog):
         gemini_hint.setObjectName("hint")
         gemini_hint_layout.addWidget(gemini_hint)
         gemini_hint_layout.addStretch()
-        gemini_link = QPushButton("キーを取得 →")
-        gemini_link.setObjectName("link")
-        gemini_link.setCursor(Qt.CursorShape.PointingHandCursor)
-        gemini_link.clicked.connect(lambda: self._open_url("https://aistudio.google.com/app/apikey"))
+        gemini_link = _make_hand_button("キーを取得 →", "link")
+        gemini_link.clicked.connect(partial(self._open_url, "https://aistudio.google.com/app/apikey"))
         gemini_hint_layout.addWidget(gemini_link)
         layout.addLayout(gemini_hint_layout)
         
@@ -371,7 +451,7 @@ class FirstRunSetupDialog(QDialog):
         layout.addWidget(openai_section)
         
         self.openai_key_input = QLineEdit()
-        self.openai_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.openai_key_input.setEchoMode(_ECHO_PASSWORD)
         self.openai_key_input.setPlaceholderText("sk-...")
         layout.addWidget(self.openai_key_input)
         
@@ -380,10 +460,8 @@ class FirstRunSetupDialog(QDialog):
         openai_hint.setObjectName("hint")
         openai_hint_layout.addWidget(openai_hint)
         openai_hint_layout.addStretch()
-        openai_link = QPushButton("キーを取得 →")
-        openai_link.setObjectName("link")
-        openai_link.setCursor(Qt.CursorShape.PointingHandCursor)
-        openai_link.clicked.connect(lambda: self._open_url("https://platform.openai.com/api-keys"))
+        openai_link = _make_hand_button("キーを取得 →", "link")
+        openai_link.clicked.connect(partial(self._open_url, "https://platform.openai.com/api-keys"))
         openai_hint_layout.addWidget(openai_link)
         layout.addLayout(openai_hint_layout)
         
@@ -395,7 +473,7 @@ class FirstRunSetupDialog(QDialog):
         layout.addWidget(anthropic_section)
         
         self.anthropic_key_input = QLineEdit()
-        self.anthropic_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.anthropic_key_input.setEchoMode(_ECHO_PASSWORD)
         self.anthropic_key_input.setPlaceholderText("sk-ant-...")
         layout.addWidget(self.anthropic_key_input)
         
@@ -404,10 +482,8 @@ class FirstRunSetupDialog(QDialog):
         anthropic_hint.setObjectName("hint")
         anthropic_hint_layout.addWidget(anthropic_hint)
         anthropic_hint_layout.addStretch()
-        anthropic_link = QPushButton("キーを取得 →")
-        anthropic_link.setObjectName("link")
-        anthropic_link.setCursor(Qt.CursorShape.PointingHandCursor)
-        anthropic_link.clicked.connect(lambda: self._open_url("https://console.anthropic.com/settings/keys"))
+        anthropic_link = _make_hand_button("キーを取得 →", "link")
+        anthropic_link.clicked.connect(partial(self._open_url, "https://console.anthropic.com/settings/keys"))
         anthropic_hint_layout.addWidget(anthropic_link)
         layout.addLayout(anthropic_hint_layout)
         
@@ -418,22 +494,20 @@ class FirstRunSetupDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.setSpacing(12)
         
-        skip_btn = QPushButton("スキップ")
-        skip_btn.setObjectName("secondary")
-        skip_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        skip_btn = _make_hand_button("スキップ", "secondary")
         skip_btn.clicked.connect(self.reject)
         button_layout.addWidget(skip_btn)
         
         button_layout.addStretch()
         
-        save_btn = QPushButton("開始する")
-        save_btn.setObjectName("primary")
-        save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        save_btn = _make_hand_button("開始する", "primary")
         save_btn.setDefault(True)
         save_btn.clicked.connect(self._save_and_accept)
         button_layout.addWidget(save_btn)
         
         layout.addLayout(button_layout)
+        
+        self.setFixedSize(440, 480)
     
     def _open_url(self, url: str):
         """Open URL in browser."""
@@ -466,278 +540,184 @@ class FirstRunSetupDialog(QDialog):
         }
 
 
-class TranscriptionWorker(QThread):
-    """Worker thread for transcription + AI processing."""
+class TranscriptionSignals(QObject):
+    """Signals emitted by TranscriptionWorker."""
     
     transcription_done = pyqtSignal(str)  # Raw transcription
     ai_chunk = pyqtSignal(str)  # Streaming AI response
     finished = pyqtSignal(str)  # Final result
     error = pyqtSignal(str)
+
+
+class TranscriptionWorker(QRunnable):
+    """Thread-pool job for transcription + AI processing."""
+    
+    # Streamed chunks are flushed every CHUNK_EMIT_INTERVAL seconds or once
+    # CHUNK_EMIT_CHARS characters are buffered, whichever comes first
+    CHUNK_EMIT_INTERVAL = 0.05
+    CHUNK_EMIT_CHARS = 64
     
     def __init__(
         self, 
         transcriber: Transcriber, 
         ai_client: Optional[AIClient],
-        audio_data: bytes,
-        process_with_ai: bool = True
+        audio_data: memoryview,
+        process_with_ai: bool = True,
+        signals: Optional[TranscriptionSignals] = None
     ):
         super().__init__()
+        # Shared, already-connected signals object (or a private one)
+        self.signals = signals or TranscriptionSignals()
         self.transcriber = transcriber
         self.ai_client = ai_client
         self.audio_data = audio_data
         self.process_with_ai = process_with_ai
+        # AI streaming callable, resolved once at submit time
+        self._stream = (
+            ai_client.process_stream if (process_with_ai and ai_client) else None
+        )
     
     def run(self):
         try:
             # Check for silence first
-            from ..audio import AudioRecorder
             if not AudioRecorder.check_audio_has_speech(self.audio_data):
-                print("[Worker] Audio too quiet (silence detected), skipping", flush=True)
-                self.finished.emit("")
+                logger.debug("[Worker] Audio too quiet (silence detected), skipping")
+                self.signals.finished.emit("")
                 return
             
             # Step 1: Transcribe
-            print(f"[Worker] Transcribing audio ({len(self.audio_data)} bytes)...", flush=True)
+            logger.debug("[Worker] Transcribing audio (%d bytes)...", len(self.audio_data))
             text = self.transcriber.transcribe(self.audio_data)
-            print(f"[Worker] Transcription: '{text[:50] if text else '(empty)'}...'", flush=True)
-            self.transcription_done.emit(text)
+            logger.debug("[Worker] Transcription: '%s...'", text[:50] if text else "(empty)")
+            self.signals.transcription_done.emit(text)
             
             if not text:
-                print("[Worker] No text, skipping AI", flush=True)
-                self.finished.emit("")
+                logger.debug("[Worker] No text, skipping AI")
+                self.signals.finished.emit("")
                 return
             
             # Step 2: AI processing (if enabled and available)
-            print(f"[Worker] AI: process_with_ai={self.process_with_ai}, client={self.ai_client is not None}", flush=True)
-            if self.process_with_ai and self.ai_client:
-                print(f"[Worker] Starting AI processing with {type(self.ai_client).__name__}...", flush=True)
-                result_text = ""
-                for chunk in self.ai_client.process_stream(text):
-                    print(f"[Worker] AI chunk: '{chunk}'", flush=True)
-                    self.ai_chunk.emit(chunk)
-                    result_text += chunk
-                print(f"[Worker] AI result: '{result_text[:50] if result_text else '(empty)'}...'", flush=True)
-                self.finished.emit(result_text)
-            else:
-                print("[Worker] Skipping AI, using raw text", flush=True)
-                self.finished.emit(text)
-                
+            if self._stream is None:
+                logger.debug("[Worker] Skipping AI, using raw text")
+                self.signals.finished.emit(text)
+                return
+            
+            logger.debug("[Worker] Starting AI processing with %s...", type(self.ai_client).__name__)
+            # Coalesce streamed chunks so the GUI thread gets one update per
+            # batch instead of one per token
+            parts = []
+            pending = []
+            pending_len = 0
+            append = parts.append
+            emit = self.signals.ai_chunk.emit
+            interval = self.CHUNK_EMIT_INTERVAL
+            max_chars = self.CHUNK_EMIT_CHARS
+            last_emit = time.monotonic()
+            for chunk in self._stream(text):
+                append(chunk)
+                pending.append(chunk)
+                pending_len += len(chunk)
+                now = time.monotonic()
+                if now - last_emit >= interval or pending_len >= max_chars:
+                    emit("".join(pending))
+                    pending.clear()
+                    pending_len = 0
+                    last_emit = now
+            if pending:
+                emit("".join(pending))
+            result_text = "".join(parts)
+            logger.debug("[Worker] AI result: '%s...'", result_text[:50] if result_text else "(empty)")
+            self.signals.finished.emit(result_text)
+            
         except Exception as e:
-            print(f"[Worker] Error: {e}", flush=True)
-            self.error.emit(str(e))
+            logger.error("[Worker] Error: %s", e)
+            self.signals.error.emit(str(e))
+
+
+class StartupSignals(QObject):
+    """Signals emitted by StartupTask."""
+    
+    done = pyqtSignal(bool, bool)  # (success, requested state)
+
+
+class StartupTask(QRunnable):
+    """Thread-pool job that writes the Windows startup shortcut."""
+    
+    def __init__(self, enabled: bool):
+        super().__init__()
+        self.signals = StartupSignals()
+        self.enabled = enabled
+    
+    def run(self):
+        # Pool threads have no COM apartment; the shortcut is written through
+        # WScript.Shell, so initialize COM for the duration of this job.
+        try:
+            import pythoncom
+        except ImportError:
+            pythoncom = None  # Not Windows / no pywin32: .bat fallback
+        if pythoncom:
+            pythoncom.CoInitialize()
+        try:
+            success = set_startup_enabled(self.enabled)
+        finally:
+            if pythoncom:
+                pythoncom.CoUninitialize()
+        self.signals.done.emit(success, self.enabled)
+
+
+class TypeSignals(QObject):
+    """Signals emitted by TypeTask."""
+    
+    done = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class TypeTask(QRunnable):
+    """Thread-pool job that types text into the focused field."""
+    
+    def __init__(self, text: str, signals: TypeSignals):
+        super().__init__()
+        self.signals = signals
+        self.text = text
+    
+    def run(self):
+        try:
+            type_to_focused_field(self.text)
+            self.signals.done.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
-    STYLE = """
-        QMainWindow {
-            background-color: #ffffff;
-        }
-        QWidget#sidebar {
-            background-color: #f8f9fa;
-            border-right: 1px solid #e9ecef;
-        }
-        QWidget#content {
-            background-color: #ffffff;
-        }
-        QListWidget {
-            background-color: transparent;
-            border: none;
-            font-size: 13px;
-            outline: none;
-        }
-        QListWidget::item {
-            padding: 12px 16px;
-            border-radius: 6px;
-            margin: 2px 8px;
-            color: #495057;
-        }
-        QListWidget::item:selected {
-            background-color: #e7f1ff;
-            color: #1971c2;
-        }
-        QListWidget::item:hover:!selected {
-            background-color: #f1f3f4;
-        }
-        QLabel#appTitle {
-            font-size: 16px;
-            font-weight: 600;
-            color: #212529;
-            padding: 16px;
-        }
-        QLabel#pageTitle {
-            font-size: 18px;
-            font-weight: 600;
-            color: #212529;
-            padding-bottom: 8px;
-        }
-        QLabel#sectionTitle {
-            font-size: 13px;
-            font-weight: 600;
-            color: #495057;
-            padding-top: 16px;
-            padding-bottom: 4px;
-        }
-        QLabel#hint {
-            font-size: 12px;
-            color: #868e96;
-        }
-        QLabel#settingLabel {
-            font-size: 13px;
-            color: #212529;
-        }
-        QLineEdit {
-            padding: 8px 12px;
-            border: 1px solid #dee2e6;
-            border-radius: 6px;
-            background: #ffffff;
-            font-size: 13px;
-            min-height: 18px;
-            color: #212529;
-        }
-        QLineEdit:focus {
-            border-color: #74c0fc;
-            outline: none;
-        }
-        QComboBox {
-            padding: 8px 12px;
-            border: 1px solid #dee2e6;
-            border-radius: 6px;
-            background: #ffffff;
-            font-size: 13px;
-            min-height: 18px;
-            color: #212529;
-        }
-        QComboBox:focus {
-            border-color: #74c0fc;
-        }
-        QComboBox::drop-down {
-            border: none;
-            width: 30px;
-            subcontrol-position: right center;
-            subcontrol-origin: padding;
-        }
-        QComboBox::down-arrow {
-            width: 0;
-            height: 0;
-            border-left: 5px solid transparent;
-            border-right: 5px solid transparent;
-            border-top: 6px solid #868e96;
-        }
-        QComboBox:disabled {
-            background: #f1f3f5;
-            color: #adb5bd;
-        }
-        QWidget#posGrid {
-            background: #343a40;
-            border-radius: 8px;
-            border: 2px solid #495057;
-        }
-        QPushButton#posBtn {
-            border: none;
-            border-radius: 3px;
-            background: transparent;
-            font-size: 10px;
-            color: #6c757d;
-            padding: 2px;
-        }
-        QPushButton#posBtn:hover {
-            background: rgba(255, 255, 255, 0.1);
-            color: #adb5bd;
-        }
-        QPushButton#posBtn:checked {
-            background: transparent;
-            color: #228be6;
-            font-size: 12px;
-        }
-        QLineEdit#hotkeyInput {
-            padding: 10px 14px;
-            border: 2px solid #dee2e6;
-            border-radius: 8px;
-            background: #ffffff;
-            font-size: 14px;
-            font-weight: 500;
-            color: #212529;
-        }
-        QLineEdit#hotkeyInput:focus {
-            border-color: #228be6;
-            background: #f8f9fa;
-        }
-        QComboBox QAbstractItemView {
-            background-color: white;
-            border: 1px solid #dee2e6;
-            selection-background-color: #e7f1ff;
-            selection-color: #212529;
-            color: #212529;
-            outline: none;
-            padding: 4px;
-        }
-        QComboBox QAbstractItemView::item {
-            padding: 6px 12px;
-            min-height: 24px;
-            color: #212529;
-            background-color: white;
-        }
-        QComboBox QAbstractItemView::item:selected {
-            background-color: #e7f1ff;
-            color: #212529;
-        }
-        QTextEdit {
-            border: 1px solid #dee2e6;
-            border-radius: 6px;
-            background: #ffffff;
-            font-size: 13px;
-            padding: 8px;
-        }
-        QCheckBox {
-            font-size: 13px;
-            color: #212529;
-            spacing: 10px;
-            padding: 4px 0;
-        }
-        QCheckBox::indicator {
-            width: 40px;
-            height: 22px;
-            border-radius: 11px;
-            border: none;
-            background: #ced4da;
-        }
-        QCheckBox::indicator:checked {
-            background: #228be6;
-        }
-        QPushButton#primary {
-            background-color: #228be6;
+    # Minimum seconds between two accepted record toggles
+    TOGGLE_DEBOUNCE = 0.15
+    
+    # Record button styles
+    _BTN_QSS_IDLE = """
+        QPushButton {
+            font-size: 24px;
+            background-color: #4CAF50;
             color: white;
-            border: none;
-            border-radius: 6px;
-            padding: 10px 20px;
-            font-size: 13px;
-            font-weight: 500;
+            border-radius: 15px;
         }
-        QPushButton#primary:hover {
-            background-color: #1c7ed6;
+        QPushButton:hover {
+            background-color: #45a049;
         }
-        QPushButton#secondary {
-            background-color: #f8f9fa;
-            color: #495057;
-            border: 1px solid #dee2e6;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-size: 13px;
-        }
-        QPushButton#secondary:hover {
-            background-color: #e9ecef;
+        QPushButton:disabled {
+            background-color: #cccccc;
         }
-        QProgressBar {
-            border: none;
-            background: #e9ecef;
-            border-radius: 2px;
-            max-height: 4px;
+    """
+    _BTN_QSS_RECORDING = """
+        QPushButton {
+            font-size: 24px;
+            background-color: #f44336;
+            color: white;
+            border-radius: 15px;
         }
-        QProgressBar::chunk {
-            background: #228be6;
-            border-radius: 2px;
+        QPushButton:hover {
+            background-color: #da190b;
         }
     """
     
@@ -760,6 +740,32 @@ class MainWindow(QMainWindow):
         self.ai_client = ai_client
         
         self._worker: Optional[TranscriptionWorker] = None
+        # Jobs submitted to the pool, oldest first (the pool runs one at a time)
+        self._jobs: deque = deque()
+        self._status_level: Optional[str] = None
+        self._ai_active_for_current_job = False
+        self._ai_receiving = False
+        # Toggle guard: ignore re-entrant calls and bounces within TOGGLE_DEBOUNCE
+        self._toggle_in_flight = False
+        self._last_toggle_ts = 0.0
+        self._startup_task: Optional[StartupTask] = None
+        self._startup_pending: Optional[bool] = None
+        self._minimize_toast_shown = False
+        # Persistent pool for transcription jobs (one at a time)
+        self._worker_pool = QThreadPool(self)
+        self._worker_pool.setMaxThreadCount(1)
+        # One signals object for every job, connected once
+        self._worker_signals = TranscriptionSignals(self)
+        self._worker_signals.transcription_done.connect(self._on_transcription_done)
+        self._worker_signals.ai_chunk.connect(self._on_ai_chunk)
+        self._worker_signals.finished.connect(self._on_finished)
+        self._worker_signals.error.connect(self._on_error)
+        # Typing runs off the UI thread, one result at a time
+        self._type_pool = QThreadPool(self)
+        self._type_pool.setMaxThreadCount(1)
+        self._type_signals = TypeSignals(self)
+        self._type_signals.done.connect(self._on_type_done)
+        self._type_signals.failed.connect(self._on_type_failed)
         
         # Audio controller for muting
         self.audio_controller: AudioController = get_audio_controller()
@@ -780,39 +786,57 @@ class MainWindow(QMainWindow):
         )
         self.hotkey_manager = HotkeyManager(
             config=self.hotkey_config,
-            on_record_start=self._on_hotkey_record_start,
-            on_record_stop=self._on_hotkey_record_stop,
+            # Emitting a signal is thread-safe, so the hook thread emits directly
+            on_record_start=self._start_recording_signal.emit,
+            on_record_stop=self._stop_recording_signal.emit,
             on_mute_toggle=self._on_hotkey_mute_toggle
         )
         
         # Connect signals for thread-safe UI updates
-        self._start_recording_signal.connect(self._start_recording)
-        self._stop_recording_signal.connect(self._stop_recording)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._start_recording_signal.connect(self._start_recording, queued)
+        self._stop_recording_signal.connect(self._stop_recording, queued)
         self._mute_changed_signal.connect(self._update_mute_status)
         
+        # Audio level and mute state are stored as they arrive and applied
+        # at ~30 Hz while recording
+        self._latest_level = 0
+        self._applied_level = 0
+        self._pending_mute: Optional[bool] = None
+        self._level_timer = QTimer(self)
+        self._level_timer.setInterval(33)
+        self._level_timer.timeout.connect(self._flush_audio_level)
+        
+        # Streamed AI text is buffered and inserted at ~15 Hz
+        self._ai_buffer: list = []
+        self._ai_flush_timer = QTimer(self)
+        self._ai_flush_timer.setSingleShot(True)
+        self._ai_flush_timer.setInterval(66)
+        self._ai_flush_timer.timeout.connect(self._flush_ai)
+        
+        # Settings toggles are collected and written to disk in one go
+        self._pending_config: dict = {}
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.setInterval(400)
+        self._config_flush_timer.timeout.connect(self._flush_config)
+        
         self._setup_ui()
-        self._setup_tray()
-        self._setup_overlay()
         
-        # Start hotkey listening
-        self.hotkey_manager.start()
+        # Defer tray, overlay and hotkey listening to the first event-loop
+        # tick so the window is ready as early as possible (run in order)
+        QTimer.singleShot(0, self._setup_tray)
+        QTimer.singleShot(0, self._setup_overlay)
+        QTimer.singleShot(0, self.hotkey_manager.start)
         
         # Show warning if transcriber is not available
         if self.transcriber is None:
-            self.status_label.setText("⚠️ 音声認識が利用不可（OpenAI APIキーを確認）")
-            self.status_label.setStyleSheet("color: orange;")
+            self._set_status("⚠️ 音声認識が利用不可（OpenAI APIキーを確認）", "warning")
             self.record_btn.setEnabled(False)
     
     def _setup_ui(self):
         """Setup the user interface with sidebar navigation."""
         self.setWindowTitle("Chotto Voice")
-        self.setFixedSize(580, 580)
-        self.setStyleSheet(self.STYLE)
-        self.setWindowFlags(
-            Qt.WindowType.Window |
-            Qt.WindowType.WindowCloseButtonHint |
-            Qt.WindowType.WindowMinimizeButtonHint
-        )
         
         # Central widget with horizontal layout
         central = QWidget()
@@ -857,10 +881,15 @@ class MainWindow(QMainWindow):
         self.page_stack = QStackedWidget()
         content_layout.addWidget(self.page_stack)
         
-        # Create pages
-        self._create_settings_page()
-        self._create_whisper_page()
-        self._create_api_page()
+        # Create pages; only the initial page is built up front, the others
+        # are built the first time they are selected
+        self.page_stack.addWidget(self._create_settings_page())
+        self._page_builders = {
+            1: self._create_whisper_page,
+            2: self._create_api_page,
+        }
+        for _ in self._page_builders:
+            self.page_stack.addWidget(QWidget())
         
         main_layout.addWidget(content)
         
@@ -868,10 +897,20 @@ class MainWindow(QMainWindow):
         self.mute_indicator = QLabel("🔊")
         self.level_bar = QProgressBar()
         self.level_bar.setMaximum(100)
-        self.result_text = QTextEdit()
+        self.result_text = QPlainTextEdit()
+        self.result_text.setUndoRedoEnabled(False)
+        self.result_text.setMaximumBlockCount(500)
         self.record_btn = QPushButton()  # Hidden, for hotkey
+        
+        # Fix size and flags once everything is in place (single layout pass)
+        self.setFixedSize(580, 580)
+        self.setWindowFlags(
+            Qt.WindowType.Window |
+            Qt.WindowType.WindowCloseButtonHint |
+            Qt.WindowType.WindowMinimizeButtonHint
+        )
     
-    def _create_settings_page(self):
+    def _create_settings_page(self) -> QWidget:
         """Create the general settings page."""
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -885,7 +924,7 @@ class MainWindow(QMainWindow):
         
         # Status
         self.status_label = QLabel("準備完了")
-        self.status_label.setObjectName("hint")
+        self.status_label.setObjectName("statusLabel")
         layout.addWidget(self.status_label)
         
         layout.addSpacing(8)
@@ -903,8 +942,9 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.ai_process_check)
         
         if sys.platform == "win32":
-            self.startup_check = QCheckBox("Windowsと一緒に起動")
-            self.startup_check.setChecked(is_startup_enabled())
+            self.startup_check = LatchedCheckBox("Windowsと一緒に起動")
+            # Seeded from the persisted setting; no Startup folder scan at launch
+            self.startup_check.setChecked(self.user_config.start_with_windows)
             self.startup_check.toggled.connect(self._on_startup_changed)
             layout.addWidget(self.startup_check)
         
@@ -916,7 +956,6 @@ class MainWindow(QMainWindow):
         layout.addWidget(overlay_label)
         
         # Create position grid (visual representation of screen)
-        from PyQt6.QtWidgets import QGridLayout, QButtonGroup
         pos_container = QWidget()
         pos_container.setObjectName("posGrid")
         pos_container.setFixedSize(180, 80)
@@ -926,28 +965,19 @@ class MainWindow(QMainWindow):
         
         self.pos_buttons = {}
         self.pos_button_group = QButtonGroup(self)
-        positions = [
-            ("top-left", 0, 0), 
-            ("top-center", 0, 1), 
-            ("top-right", 0, 2),
-            ("bottom-left", 1, 0), 
-            ("bottom-center", 1, 1), 
-            ("bottom-right", 1, 2)
-        ]
         
         current_pos = self.user_config.overlay_position
-        for pos_key, row, col in positions:
-            btn = QPushButton("●")
-            btn.setObjectName("posBtn")
+        for i, (pos_key, row, col) in enumerate(_POSITIONS):
+            btn = _make_hand_button("●", "posBtn")
             btn.setCheckable(True)
             btn.setFixedSize(52, 32)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
             if pos_key == current_pos:
                 btn.setChecked(True)
-            btn.clicked.connect(lambda checked, k=pos_key: self._on_position_btn_clicked(k))
             self.pos_buttons[pos_key] = btn
-            self.pos_button_group.addButton(btn)
+            self.pos_button_group.addButton(btn, i)
             pos_grid.addWidget(btn, row, col)
+        # One connection for the whole grid; the button id indexes _POSITIONS
+        self.pos_button_group.idClicked.connect(self._on_position_id_clicked)
         
         layout.addWidget(pos_container)
         
@@ -955,11 +985,6 @@ class MainWindow(QMainWindow):
         pos_hint.setObjectName("hint")
         layout.addWidget(pos_hint)
         
-        # Keep combo hidden for compatibility
-        self.overlay_position_combo = QComboBox()
-        self.overlay_position_combo.hide()
-        self.pos_status_label = QLabel()  # Hidden, for compatibility
-        
         layout.addSpacing(16)
         
         # Hotkey
@@ -987,25 +1012,24 @@ class MainWindow(QMainWindow):
         
         preset_row = QHBoxLayout()
         preset_row.setSpacing(6)
-        for name, key in [("右Ctrl", "right ctrl"), ("右Shift", "right shift"), ("右Alt", "right alt"), ("F9", "f9")]:
-            btn = QPushButton(name)
-            btn.setObjectName("secondary")
+        self.preset_button_group = QButtonGroup(self)
+        self.preset_button_group.setExclusive(False)
+        for i, (name, _key) in enumerate(_INLINE_PRESETS):
+            btn = _make_hand_button(name, "secondary")
             btn.setFixedHeight(28)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda checked, k=key: self._set_hotkey_preset(k))
+            self.preset_button_group.addButton(btn, i)
             preset_row.addWidget(btn)
+        self.preset_button_group.idClicked.connect(self._on_preset_id_clicked)
         preset_row.addStretch()
         layout.addLayout(preset_row)
         
         # Keep reference for compatibility
         self.hotkey_label = self.hotkey_input
-        self.hotkey_btn = QPushButton()
-        self.hotkey_btn.hide()
         
         layout.addStretch()
-        self.page_stack.addWidget(page)
+        return page
     
-    def _create_whisper_page(self):
+    def _create_whisper_page(self) -> QWidget:
         """Create the Whisper/speech recognition page."""
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -1049,8 +1073,8 @@ class MainWindow(QMainWindow):
         self.whisper_model_combo.addItem("base（バランス・74MB）", "base")
         self.whisper_model_combo.addItem("small（高精度・244MB）", "small")
         self.whisper_model_combo.setFixedWidth(250)
-        model_map = {"tiny": 0, "base": 1, "small": 2}
-        self.whisper_model_combo.setCurrentIndex(model_map.get(self.user_config.whisper_local_model, 2))
+        model_index = self.whisper_model_combo.findData(self.user_config.whisper_local_model)
+        self.whisper_model_combo.setCurrentIndex(model_index if model_index >= 0 else 2)  # Default: small
         self.whisper_model_combo.setEnabled(current_provider == "local")
         self.whisper_model_combo.currentIndexChanged.connect(self._on_whisper_model_changed)
         layout.addWidget(self.whisper_model_combo)
@@ -1060,9 +1084,9 @@ class MainWindow(QMainWindow):
         layout.addWidget(model_hint)
         
         layout.addStretch()
-        self.page_stack.addWidget(page)
+        return page
     
-    def _create_api_page(self):
+    def _create_api_page(self) -> QWidget:
         """Create the API keys page."""
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -1086,7 +1110,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(gemini_label)
         
         self.gemini_key_input = QLineEdit()
-        self.gemini_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.gemini_key_input.setEchoMode(_ECHO_PASSWORD)
         self.gemini_key_input.setPlaceholderText("AIza...")
         if self.user_config.gemini_api_key:
             self.gemini_key_input.setText(self.user_config.gemini_api_key)
@@ -1098,7 +1122,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(openai_label)
         
         self.openai_key_input = QLineEdit()
-        self.openai_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.openai_key_input.setEchoMode(_ECHO_PASSWORD)
         self.openai_key_input.setPlaceholderText("sk-...")
         if self.user_config.openai_api_key:
             self.openai_key_input.setText(self.user_config.openai_api_key)
@@ -1110,7 +1134,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(anthropic_label)
         
         self.anthropic_key_input = QLineEdit()
-        self.anthropic_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.anthropic_key_input.setEchoMode(_ECHO_PASSWORD)
         self.anthropic_key_input.setPlaceholderText("sk-ant-...")
         if self.user_config.anthropic_api_key:
             self.anthropic_key_input.setText(self.user_config.anthropic_api_key)
@@ -1121,50 +1145,58 @@ class MainWindow(QMainWindow):
         # Save button
         save_row = QHBoxLayout()
         save_row.addStretch()
-        save_btn = QPushButton("保存")
-        save_btn.setObjectName("primary")
-        save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        save_btn = _make_hand_button("保存", "primary")
         save_btn.clicked.connect(self._save_api_keys)
         save_row.addWidget(save_btn)
         layout.addLayout(save_row)
         
         layout.addStretch()
-        self.page_stack.addWidget(page)
+        return page
     
     def _on_nav_changed(self, index: int):
-        """Handle navigation change."""
+        """Handle navigation change, building the page on first visit."""
+        builder = self._page_builders.pop(index, None)
+        if builder is not None:
+            placeholder = self.page_stack.widget(index)
+            self.page_stack.insertWidget(index, builder())
+            self.page_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
         self.page_stack.setCurrentIndex(index)
     
     def _on_position_btn_clicked(self, position: str):
         """Handle position button click."""
+        if position == self.overlay.position:
+            return
         self.overlay.set_position(position)
-        self.user_config.update(overlay_position=position)
+        self._queue_config(overlay_position=position)
+    
+    @pyqtSlot(int)
+    def _on_position_id_clicked(self, index: int):
+        """Handle a click in the position grid."""
+        self._on_position_btn_clicked(_POSITIONS[index][0])
     
     def _get_pos_label(self, pos: str) -> str:
         """Get Japanese label for position."""
-        labels = {
-            "top-left": "左上",
-            "top-center": "上中央", 
-            "top-right": "右上",
-            "bottom-left": "左下",
-            "bottom-center": "下中央",
-            "bottom-right": "右下"
-        }
-        return labels.get(pos, pos)
+        return _POS_LABELS.get(pos, pos)
     
     def _on_inline_hotkey_captured(self, hotkey: str):
         """Handle inline hotkey capture."""
         if hotkey:
             self.hotkey_config.key = hotkey
             self.hotkey_manager.update_hotkey(hotkey)
-            self.user_config.update(hotkey=hotkey)
+            self._queue_config(hotkey=hotkey)
+    
+    @pyqtSlot(int)
+    def _on_preset_id_clicked(self, index: int):
+        """Handle a click on an inline hotkey preset."""
+        self._set_hotkey_preset(_INLINE_PRESETS[index][1])
     
     def _set_hotkey_preset(self, key: str):
         """Set a preset hotkey."""
         self.hotkey_input.setText(key)
         self.hotkey_config.key = key
         self.hotkey_manager.update_hotkey(key)
-        self.user_config.update(hotkey=key)
+        self._queue_config(hotkey=key)
     
     def _setup_overlay(self):
         """Setup the overlay indicator."""
@@ -1183,86 +1215,126 @@ class MainWindow(QMainWindow):
         self._icon_normal = create_tray_icon()
         self._icon_recording = create_recording_icon()
         self._icon_processing = create_processing_icon()
+        # Tray state -> (icon, tooltip)
+        self._tray_states = {
+            "idle": (self._icon_normal, "Chotto Voice 🎤"),
+            "recording": (self._icon_recording, "Chotto Voice 🔴 録音中..."),
+            "processing": (self._icon_processing, "Chotto Voice ⏳ 処理中..."),
+        }
+        self._tray_state: Optional[str] = None
         
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(self._icon_normal)
-        self.tray_icon.setToolTip("Chotto Voice 🎤")
-        
-        # Tray menu
-        tray_menu = QMenu()
-        
-        # Recording control
-        self.tray_record_action = QAction("🎤 録音開始", self)
-        self.tray_record_action.triggered.connect(self._toggle_recording)
-        tray_menu.addAction(self.tray_record_action)
-        
-        tray_menu.addSeparator()
-        
-        # Settings
-        settings_action = QAction("⚙️ 設定", self)
-        settings_action.triggered.connect(self._show_settings)
-        tray_menu.addAction(settings_action)
-        
-        tray_menu.addSeparator()
+        self._set_tray("idle")
         
-        # Quit
-        quit_action = QAction("終了", self)
-        quit_action.triggered.connect(self._quit_app)
-        tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(tray_menu)
+        # Tray menu (actions are created on first show)
+        self._tray_menu = QMenu(self)
+        self._tray_menu.aboutToShow.connect(self._populate_tray_menu)
+        self.tray_record_action: Optional[QAction] = None
+        self.tray_icon.setContextMenu(self._tray_menu)
         self.tray_icon.activated.connect(self._tray_activated)
         self.tray_icon.show()
         
-        # Show startup notification
+        # Show startup notification once the tray icon has settled
+        QTimer.singleShot(500, self._show_startup_notification)
+    
+    def _set_tray(self, state: str):
+        """Switch the tray icon and tooltip, skipping no-op transitions."""
+        if state == self._tray_state:
+            return
+        icon, tip = self._tray_states[state]
+        self.tray_icon.setIcon(icon)
+        self.tray_icon.setToolTip(tip)
+        self._tray_state = state
+    
+    def _populate_tray_menu(self):
+        """Build the tray menu on first show and sync the record action."""
+        if self.tray_record_action is None:
+            menu = self._tray_menu
+            
+            # Recording control
+            self.tray_record_action = QAction(self)
+            self.tray_record_action.triggered.connect(self._toggle_recording)
+            menu.addAction(self.tray_record_action)
+            
+            menu.addSeparator()
+            
+            # Settings
+            settings_action = QAction("⚙️ 設定", self)
+            settings_action.triggered.connect(self._show_settings)
+            menu.addAction(settings_action)
+            
+            menu.addSeparator()
+            
+            # Quit
+            quit_action = QAction("終了", self)
+            quit_action.triggered.connect(self._quit_app)
+            menu.addAction(quit_action)
+        
+        self.tray_record_action.setText(
+            "⏹️ 録音停止" if self.recorder.is_recording else "🎤 録音開始"
+        )
+    
+    def _show_startup_notification(self):
+        """Show the tray notification announcing startup."""
         self.tray_icon.showMessage(
-            "Chotto Voice",
+            _TRAY_TITLE,
             f"システムトレイで起動しました\nホットキー: {self.hotkey_config.key}",
-            QSystemTrayIcon.MessageIcon.Information,
+            _MSG_INFO,
             2000
         )
     
+    def _set_status(self, text: str, level: Optional[str] = None):
+        """Set status text, restyling only when the level changes.
+        
+        The level is exposed as the label's "level" property and matched by
+        the QLabel#statusLabel[level=...] rules in the app stylesheet.
+        """
+        label = self.status_label
+        label.setText(text)
+        if level is not None and level != self._status_level:
+            self._status_level = level
+            label.setProperty("level", level)
+            style = label.style()
+            style.unpolish(label)
+            style.polish(label)
+    
     def _toggle_recording(self):
         """Toggle recording state."""
-        if self.recorder.is_recording:
-            self._stop_recording()
-        else:
-            self._start_recording()
+        now = time.monotonic()
+        if self._toggle_in_flight or now - self._last_toggle_ts < self.TOGGLE_DEBOUNCE:
+            return
+        self._toggle_in_flight = True
+        self._last_toggle_ts = now
+        try:
+            if self.recorder.is_recording:
+                self._stop_recording()
+            else:
+                self._start_recording()
+        finally:
+            self._toggle_in_flight = False
     
     def _start_recording(self):
         """Start recording."""
         # Check if transcriber is available
         if self.transcriber is None:
-            self.status_label.setText("❌ 音声認識が設定されていません（APIキーを確認）")
-            self.status_label.setStyleSheet("color: red;")
+            self._set_status("❌ 音声認識が設定されていません（APIキーを確認）", "error")
             return
         
         # Fade out system audio
         self.audio_controller.fade_out(duration=0.3)
         
+        self._latest_level = 0
         self.recorder.on_audio_level = self._update_audio_level
         self.recorder.start_recording()
+        self._level_timer.start()
         
         self.record_btn.setText("⏹️ 録音停止")
-        self.record_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 24px;
-                background-color: #f44336;
-                color: white;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
-        self.status_label.setText("🔴 録音中...")
-        self.status_label.setStyleSheet("color: red; font-weight: bold;")
+        self.record_btn.setStyleSheet(self._BTN_QSS_RECORDING)
+        self._set_status("🔴 録音中...", "recording")
         self.result_text.clear()
         
         # Update tray and overlay
-        self.tray_record_action.setText("⏹️ 録音停止")
-        self.tray_icon.setIcon(self._icon_recording)
-        self.tray_icon.setToolTip("Chotto Voice 🔴 録音中...")
+        self._set_tray("recording")
         self.overlay.set_state("recording")
         
         # Sync hotkey manager state
@@ -1271,142 +1343,152 @@ class MainWindow(QMainWindow):
     def _stop_recording(self):
         """Stop recording and process."""
         audio_data = self.recorder.stop_recording()
+        self._level_timer.stop()
+        self._apply_mute_status()
         
         # Fade in system audio
         self.audio_controller.fade_in(duration=0.3)
         
         self.record_btn.setText("🎤 録音開始")
-        self.record_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 24px;
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.record_btn.setStyleSheet(self._BTN_QSS_IDLE)
         self.level_bar.setValue(0)
-        
-        # Update tray
-        self.tray_record_action.setText("🎤 録音開始")
+        self._applied_level = 0
         
         # Sync hotkey manager state
         self.hotkey_manager.set_recording_state(False)
         
         if audio_data:
             # Go directly to processing state (skip idle to avoid animation glitch)
-            self.status_label.setText("⏳ 処理中...")
-            self.status_label.setStyleSheet("color: orange;")
+            self._set_status("⏳ 処理中...", "warning")
             self.record_btn.setEnabled(False)
-            self.tray_icon.setIcon(self._icon_processing)
-            self.tray_icon.setToolTip("Chotto Voice ⏳ 処理中...")
+            self._set_tray("processing")
             self.overlay.set_state("processing")
             
-            # Start worker
+            # Start worker (AI setting is fixed for the duration of the job)
+            self._ai_active_for_current_job = self._process_with_ai and self.ai_client is not None
             self._worker = TranscriptionWorker(
                 self.transcriber,
                 self.ai_client,
                 audio_data,
-                self._process_with_ai and self.ai_client is not None
+                self._ai_active_for_current_job,
+                self._worker_signals
             )
-            self._worker.transcription_done.connect(self._on_transcription_done)
-            self._worker.ai_chunk.connect(self._on_ai_chunk)
-            self._worker.finished.connect(self._on_finished)
-            self._worker.error.connect(self._on_error)
-            self._worker.start()
+            self._jobs.append(self._worker)
+            self._worker_pool.start(self._worker)
         else:
             # No audio data - go to idle state
-            self.tray_icon.setIcon(self._icon_normal)
-            self.tray_icon.setToolTip("Chotto Voice 🎤")
+            self._set_tray("idle")
             self.overlay.set_state("idle")
-            self.status_label.setText("音声が検出されませんでした")
-            self.status_label.setStyleSheet("color: gray;")
+            self._set_status("音声が検出されませんでした", "info")
     
-    def _update_audio_level(self, level: float):
-        """Update audio level indicator."""
-        scaled = min(int(level * 1000), 100)
-        self.level_bar.setValue(scaled)
-        # Also update overlay waveform
-        self.overlay.set_audio_level(level * 10)  # Scale for visibility
+    def _update_audio_level(self, level: int):
+        """Store the latest audio level (called from the audio thread, 0-100)."""
+        self._latest_level = level
+    
+    def _flush_audio_level(self):
+        """Apply the latest audio level and any pending mute state to the UI."""
+        level = self._latest_level
+        if level != self._applied_level:
+            self._applied_level = level
+            self.level_bar.setValue(level)
+        # Feed the overlay every tick (the timer only runs while recording):
+        # a tick without a level is drawn as filler, so a steady level must
+        # still be reported
+        self.overlay.set_audio_level(level / 100)
+        if self._pending_mute is not None:
+            self._apply_mute_status()
     
     def _on_transcription_done(self, text: str):
         """Handle transcription completion."""
         # Only show if not processing with AI (AI will replace it)
-        if text and not (self._process_with_ai and self.ai_client):
-            self.result_text.setText(text)
+        if text and not self._ai_active_for_current_job:
+            self.result_text.setPlainText(text)
         self._final_result = text
     
     def _on_ai_chunk(self, chunk: str):
         """Handle AI response chunk - update result with AI processed text."""
         # First chunk - clear the display
-        if not hasattr(self, '_ai_receiving'):
+        if not self._ai_receiving:
             self._ai_receiving = True
             self.result_text.clear()
-        self.result_text.insertPlainText(chunk)
+            # Keep one cursor parked at the end of the document for appends
+            self._ai_cursor = QTextCursor(self.result_text.document())
+            self._ai_cursor.movePosition(QTextCursor.MoveOperation.End)
+        # Buffer and insert in batches (~15 Hz) rather than per chunk
+        self._ai_buffer.append(chunk)
+        if not self._ai_flush_timer.isActive():
+            self._ai_flush_timer.start()
+    
+    def _flush_ai(self):
+        """Insert buffered AI text into the result view."""
+        self._ai_flush_timer.stop()
+        if self._ai_buffer:
+            self._ai_cursor.insertText("".join(self._ai_buffer))
+            self._ai_buffer.clear()
+    
+    def _release_worker(self):
+        """Drop the oldest finished job to free its audio buffer."""
+        if not self._jobs:
+            return
+        worker = self._jobs.popleft()
+        worker.audio_data = None
+        if worker is self._worker:
+            self._worker = None
     
     def _on_finished(self, text: str):
         """Handle processing completion."""
+        self._release_worker()
+        self._flush_ai()
         self.record_btn.setEnabled(True)
-        self.status_label.setText("✅ 完了")
-        self.status_label.setStyleSheet("color: green;")
+        self._set_status("✅ 完了", "success")
         
         # Reset flags
-        if hasattr(self, '_ai_receiving'):
-            delattr(self, '_ai_receiving')
+        self._ai_receiving = False
         
         # Only update if we weren't streaming (streaming already updated)
-        if not self._process_with_ai or not self.ai_client:
+        if not self._ai_active_for_current_job:
             if text:
-                self.result_text.setText(text)
+                self.result_text.setPlainText(text)
         
         # Restore tray icon and overlay
-        self.tray_icon.setIcon(self._icon_normal)
-        self.tray_icon.setToolTip("Chotto Voice 🎤")
+        self._set_tray("idle")
         self.overlay.set_state("idle")
         
-        print(f"[Finished] text='{text[:30] if text else '(empty)'}...', auto_type={self._auto_type}", flush=True)
+        logger.debug("[Finished] text=%.30r auto_type=%s", text, self._auto_type)
         if text and self._auto_type:
-            # Small delay then type to focused field
-            QTimer.singleShot(100, lambda: self._type_result(text))
+            self._type_result(text)
     
     def _type_result(self, text: str):
-        """Type result to focused field."""
-        print(f"[TypeResult] Typing: '{text[:30] if text else '(empty)'}...'", flush=True)
-        try:
-            type_to_focused_field(text)
-            print("[TypeResult] Success", flush=True)
-            self.status_label.setText("✅ 入力完了")
-        except Exception as e:
-            print(f"[TypeResult] Error: {e}", flush=True)
-            self.status_label.setText(f"入力エラー: {e}")
-            self.status_label.setStyleSheet("color: red;")
+        """Type result to focused field (in the typing pool)."""
+        logger.debug("[TypeResult] Typing: %.30r", text)
+        self._type_pool.start(TypeTask(text, self._type_signals))
+    
+    @pyqtSlot()
+    def _on_type_done(self):
+        """Handle a completed typing job."""
+        logger.debug("[TypeResult] Success")
+        self._set_status("✅ 入力完了")
+    
+    @pyqtSlot(str)
+    def _on_type_failed(self, error: str):
+        """Handle a failed typing job."""
+        logger.error("[TypeResult] Error: %s", error)
+        self._set_status(f"入力エラー: {error}", "error")
     
     def _on_error(self, error: str):
         """Handle error."""
+        self._release_worker()
+        self._flush_ai()
         self.record_btn.setEnabled(True)
-        self.status_label.setText(f"❌ エラー: {error}")
-        self.status_label.setStyleSheet("color: red;")
+        self._set_status(f"❌ エラー: {error}", "error")
+        self._ai_receiving = False
         
         # Restore tray icon and overlay
-        self.tray_icon.setIcon(self._icon_normal)
-        self.tray_icon.setToolTip("Chotto Voice 🎤")
+        self._set_tray("idle")
         self.overlay.set_state("idle")
     
     # === Hotkey callbacks ===
     
-    def _on_hotkey_record_start(self):
-        """Called when hotkey triggers record start."""
-        self._start_recording_signal.emit()
-    
-    def _on_hotkey_record_stop(self):
-        """Called when hotkey triggers record stop."""
-        self._stop_recording_signal.emit()
-    
     def _on_hotkey_mute_toggle(self, should_mute: bool):
         """Called when hotkey triggers mute toggle."""
         if should_mute:
@@ -1419,7 +1501,17 @@ class MainWindow(QMainWindow):
         self._mute_changed_signal.emit(should_mute)
     
     def _update_mute_status(self, is_muted: bool):
-        """Update mute indicator."""
+        """Queue a mute indicator update for the next UI tick."""
+        self._pending_mute = is_muted
+        if not self._level_timer.isActive():
+            self._apply_mute_status()
+    
+    def _apply_mute_status(self):
+        """Apply a pending mute state to the indicator."""
+        is_muted = self._pending_mute
+        if is_muted is None:
+            return
+        self._pending_mute = None
         self.mute_indicator.setText("🔇" if is_muted else "🔊")
     
     def _save_api_keys(self):
@@ -1438,24 +1530,20 @@ class MainWindow(QMainWindow):
         # Reinitialize transcriber if OpenAI key provided
         if openai_key:
             try:
-                from ..transcriber import create_transcriber
                 self.transcriber = create_transcriber(
                     provider="openai_api",
                     api_key=openai_key,
                     model="whisper-1"
                 )
                 self.record_btn.setEnabled(True)
-                self.status_label.setText("✅ APIキー保存完了")
-                self.status_label.setStyleSheet("color: green;")
+                self._set_status("✅ APIキー保存完了", "success")
             except Exception as e:
-                self.status_label.setText(f"❌ Transcriber初期化エラー: {e}")
-                self.status_label.setStyleSheet("color: red;")
+                self._set_status(f"❌ Transcriber初期化エラー: {e}", "error")
         
         # Reinitialize AI client (prefer Gemini=free, then Anthropic, then OpenAI)
         self.ai_client = None
         if gemini_key:
             try:
-                from ..ai_client import create_ai_client
                 self.ai_client = create_ai_client(
                     provider="gemini",
                     api_key=gemini_key,
@@ -1468,7 +1556,6 @@ class MainWindow(QMainWindow):
         
         if not self.ai_client and anthropic_key:
             try:
-                from ..ai_client import create_ai_client
                 self.ai_client = create_ai_client(
                     provider="claude",
                     api_key=anthropic_key,
@@ -1481,7 +1568,6 @@ class MainWindow(QMainWindow):
         
         if not self.ai_client and openai_key:
             try:
-                from ..ai_client import create_ai_client
                 self.ai_client = create_ai_client(
                     provider="openai",
                     api_key=openai_key,
@@ -1493,45 +1579,64 @@ class MainWindow(QMainWindow):
                 print(f"AI client error: {e}")
         
         # Show notification
-        self.tray_icon.showMessage(
-            "Chotto Voice",
-            "APIキーを保存しました。",
-            QSystemTrayIcon.MessageIcon.Information,
-            2000
-        )
+        self.tray_icon.showMessage(_TRAY_TITLE, _TRAY_MSG_API_SAVED, _MSG_INFO, 2000)
     
+    @pyqtSlot(bool)
     def _on_auto_type_changed(self, checked: bool):
         """Handle auto-type checkbox change."""
         self._auto_type = checked
-        self.user_config.update(auto_type=checked)
+        self._queue_config(auto_type=checked)
     
+    @pyqtSlot(bool)
     def _on_ai_process_changed(self, checked: bool):
         """Handle AI process checkbox change."""
         self._process_with_ai = checked
-        self.user_config.update(process_with_ai=checked)
+        self._queue_config(process_with_ai=checked)
     
+    @pyqtSlot(bool)
     def _on_startup_changed(self, checked: bool):
         """Handle Windows startup checkbox change."""
-        success = set_startup_enabled(checked)
+        if self._startup_task is not None:
+            # A write is in flight; apply only the latest state after it
+            self._startup_pending = checked
+            return
+        # The shortcut is written off the UI thread; result comes back queued
+        self._startup_task = StartupTask(checked)
+        self._startup_task.signals.done.connect(self._on_startup_result)
+        QThreadPool.globalInstance().start(self._startup_task)
+    
+    @pyqtSlot(bool, bool)
+    def _on_startup_result(self, success: bool, checked: bool):
+        """Apply the result of a startup shortcut change."""
+        self._startup_task = None
+        pending, self._startup_pending = self._startup_pending, None
+        if pending is not None and pending != checked:
+            # Superseded by a later toggle
+            self._on_startup_changed(pending)
+            return
         if not success:
             # Revert checkbox if failed
-            self.startup_check.blockSignals(True)
-            self.startup_check.setChecked(not checked)
-            self.startup_check.blockSignals(False)
-            self.tray_icon.showMessage(
-                "Chotto Voice",
-                "スタートアップ設定に失敗しました",
-                QSystemTrayIcon.MessageIcon.Warning,
-                2000
-            )
+            self.startup_check.setCheckedSilently(not checked)
+            self.tray_icon.showMessage(_TRAY_TITLE, _TRAY_MSG_STARTUP_FAIL, _MSG_WARN, 2000)
         else:
-            self.user_config.update(start_with_windows=checked)
+            self._queue_config(start_with_windows=checked)
     
-    def _on_overlay_position_changed(self, index: int):
-        """Handle overlay position change."""
-        position = self.overlay_position_combo.itemData(index)
-        self.overlay.set_position(position)
-        self.user_config.update(overlay_position=position)
+    def _queue_config(self, **kwargs):
+        """Queue settings for a debounced save."""
+        self._pending_config.update(kwargs)
+        self._config_flush_timer.start()
+    
+    def _flush_config(self):
+        """Write queued settings that differ from the loaded config."""
+        self._config_flush_timer.stop()
+        config = self.user_config
+        dirty = {
+            key: value for key, value in self._pending_config.items()
+            if getattr(config, key, _UNSET) != value
+        }
+        self._pending_config.clear()
+        if dirty:
+            config.update(**dirty)
     
     def _on_whisper_provider_changed(self, index: int):
         """Handle Whisper provider change."""
@@ -1559,62 +1664,59 @@ class MainWindow(QMainWindow):
         
         if provider == "local":
             try:
-                from ..transcriber import create_transcriber
                 model = self.user_config.whisper_local_model
                 self.transcriber = create_transcriber(
                     provider="local",
                     model=model
                 )
                 self.record_btn.setEnabled(True)
-                self.status_label.setText(f"✅ ローカルWhisper ({model})")
-                self.status_label.setStyleSheet("color: green;")
+                self._set_status(f"✅ ローカルWhisper ({model})", "success")
             except Exception as e:
-                self.status_label.setText(f"❌ Whisperエラー: {e}")
-                self.status_label.setStyleSheet("color: red;")
+                self._set_status(f"❌ Whisperエラー: {e}", "error")
         else:  # API
             openai_key = self.user_config.openai_api_key
             if openai_key:
                 try:
-                    from ..transcriber import create_transcriber
                     self.transcriber = create_transcriber(
                         provider="openai_api",
                         api_key=openai_key,
                         model="whisper-1"
                     )
                     self.record_btn.setEnabled(True)
-                    self.status_label.setText("✅ Whisper API")
-                    self.status_label.setStyleSheet("color: green;")
+                    self._set_status("✅ Whisper API", "success")
                 except Exception as e:
-                    self.status_label.setText(f"❌ API エラー: {e}")
-                    self.status_label.setStyleSheet("color: red;")
+                    self._set_status(f"❌ API エラー: {e}", "error")
             else:
-                self.status_label.setText("⚠️ OpenAI APIキーが必要です")
-                self.status_label.setStyleSheet("color: orange;")
+                self._set_status("⚠️ OpenAI APIキーが必要です", "warning")
     
+    @pyqtSlot()
     def _open_hotkey_settings(self):
         """Open hotkey settings dialog."""
-        # Temporarily disable hotkey listening
-        self.hotkey_manager.stop()
-        
-        dialog = HotkeySettingsDialog(self.hotkey_config.key, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            new_hotkey = dialog.get_hotkey()
-            if new_hotkey:
-                self.hotkey_config.key = new_hotkey
-                self.hotkey_manager.update_hotkey(new_hotkey)
-                self.hotkey_label.setText(f"⌨️ ホットキー: {new_hotkey}")
-                # Save to persistent config
-                self.user_config.update(hotkey=new_hotkey)
-        
-        # Re-enable hotkey listening
-        self.hotkey_manager.start()
+        # Ignore hotkey events while the dialog is open (hooks stay installed)
+        self.hotkey_manager.pause()
+        try:
+            dialog = HotkeySettingsDialog(self.hotkey_config.key, self)
+            if dialog.exec() == _DIALOG_ACCEPTED:
+                new_hotkey = dialog.get_hotkey()
+                if new_hotkey:
+                    self.hotkey_config.key = new_hotkey
+                    self.hotkey_manager.update_hotkey(new_hotkey)
+                    self.hotkey_label.setText(_HOTKEY_LABEL_PREFIX + new_hotkey)
+                    # Save to persistent config (debounced)
+                    self._queue_config(hotkey=new_hotkey)
+        finally:
+            self.hotkey_manager.resume()
     
+    @pyqtSlot()
     def _show_settings(self):
         """Show the settings window."""
+        if self.isVisible() and self.isActiveWindow():
+            return
         self.show()
         self.activateWindow()
         self.raise_()
     
+    @pyqtSlot(QSystemTrayIcon.ActivationReason)
     def _tray_activated(self, reason):
         """Handle tray icon activation."""
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
@@ -1626,22 +1728,21 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event: QCloseEvent):
         """Handle close event - minimize to tray."""
         event.ignore()
+        self._flush_config()
         self.hide()
-        self.tray_icon.showMessage(
-            "Chotto Voice",
-            "システムトレイで動作中",
-            QSystemTrayIcon.MessageIcon.Information,
-            1500
-        )
+        if not self._minimize_toast_shown:
+            self.tray_icon.showMessage(_TRAY_TITLE, _TRAY_MSG_MINIMIZED, _MSG_INFO, 1500)
+            self._minimize_toast_shown = True
     
+    @pyqtSlot()
     def _quit_app(self):
         """Quit the application."""
+        self._flush_config()
+        self.user_config.sync()
         self.hotkey_manager.stop()
         
-        if self.hotkey_manager.is_muted:
-            if not self._was_muted_before_recording:
-                self.audio_controller.unmute()
+        if self.hotkey_manager.is_muted and not self._was_muted_before_recording:
+            self.audio_controller.unmute()
         
         self.tray_icon.hide()
-        from PyQt6.QtWidgets import QApplication
         QApplication.quit()
@@ -1,9 +1,14 @@
 """Overlay indicator for Chotto Voice - iOS-style recording indicator."""
 from PyQt6.QtWidgets import QWidget, QApplication, QMenu
-from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QFont, QPainterPath, QAction, QCursor
-import time
+from PyQt6.QtCore import Qt, QTimer, QRect, QRectF, QPointF, QPropertyAnimation, QEasingCurve, QElapsedTimer, pyqtProperty, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QFont, QAction, QCursor, QPixmap, QStaticText, QFontMetricsF, QPainterPath, QRegion
+from typing import Optional
+import logging
+import math
 import random
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 
 # Position options
@@ -17,6 +22,16 @@ OVERLAY_POSITIONS = {
 }
 
 
+def _alpha_steps(color: QColor, opacities) -> tuple:
+    """Copies of color with each of the given alpha values."""
+    steps = []
+    for opacity in opacities:
+        c = QColor(color)
+        c.setAlphaF(opacity)
+        steps.append(c)
+    return tuple(steps)
+
+
 class OverlayIndicator(QWidget):
     """iOS-style overlay indicator with configurable position."""
     
@@ -32,6 +47,9 @@ class OverlayIndicator(QWidget):
     RECORDING_HEIGHT = 36
     
     MARGIN = 20  # Margin from screen edges
+    WAVEFORM_BARS = 40  # Samples kept for the waveform
+    BAR_WIDTH = 2
+    MIC_MARGIN = 4  # Inset of the mic / processing circle
     
     # Colors
     BG_COLOR = QColor(45, 45, 48, 230)  # Dark gray, slightly transparent
@@ -41,28 +59,63 @@ class OverlayIndicator(QWidget):
     WAVEFORM_COLOR = QColor(180, 180, 180)  # Light gray
     TIMER_COLOR = QColor(160, 160, 160)  # Gray
     PROCESSING_COLOR = QColor(255, 152, 0)  # Orange
+    # Brushes and pens shared by every paint instead of rebuilt per frame
+    BG_BRUSH = QBrush(BG_COLOR)
+    BORDER_PEN = QPen(QColor(80, 80, 100), 1)
+    HOVER_BORDER_PEN = QPen(QColor(150, 150, 170), 1)
+    IDLE_DOT_BRUSH = QBrush(IDLE_DOT_COLOR)
+    MIC_BG_BRUSH = QBrush(MIC_BG_COLOR)
+    MIC_ICON_BRUSH = QBrush(MIC_ICON_COLOR)
+    MIC_ICON_PEN = QPen(MIC_ICON_COLOR, 1.5)
+    WAVEFORM_BRUSH = QBrush(WAVEFORM_COLOR)
+    TIMER_PEN = QPen(TIMER_COLOR)
+    # Processing pulse: opacity 0.4 -> 1.0 in 0.05 steps, one color per level
+    PULSE_COLORS = _alpha_steps(PROCESSING_COLOR, [step * 0.05 for step in range(8, 21)])
     
     def __init__(self, position: str = "bottom-right"):
         super().__init__()
         self._state = "idle"  # idle, recording, processing
         self._position = position
-        self._recording_start_time = 0
-        self._audio_levels = [0.1] * 30  # Waveform data (fewer bars for smaller size)
+        self._recording_clock = QElapsedTimer()  # Monotonic, started per recording
+        self._time_str = "0:00"
+        # Waveform ring buffer; _level_head is the oldest sample
+        self._audio_levels = np.full(self.WAVEFORM_BARS, 0.1)
+        self._level_head = 0
+        self._pending_level = -1.0  # Peak since the last tick; < 0 means none
         self._current_width = float(self.IDLE_WIDTH)
         self._current_height = float(self.IDLE_HEIGHT)
         self._target_width = float(self.IDLE_WIDTH)
         self._target_height = float(self.IDLE_HEIGHT)
-        self._pulse_opacity = 1.0
+        self._pulse_level = len(self.PULSE_COLORS) - 1  # Index into PULSE_COLORS
         self._pulse_direction = -1
         self._hover_scale = 1.0
         self._shake_offset = 0.0
         self._is_hovered = False
+        self._bg_rect = QRectF()
+        self._static_pixmap: Optional[QPixmap] = None
+        self._static_key = None
+        self._processing_pixmaps: dict = {}
+        self._processing_key = None
+        self._timer_font = QFont("SF Pro", 11)
+        self._timer_font.setWeight(QFont.Weight.Medium)
+        self._timer_pixmap: Optional[QPixmap] = None
+        self._processing_font = QFont("Yu Gothic UI", 10)
+        self._processing_text = QStaticText("処理中")
+        self._processing_text.setTextFormat(Qt.TextFormat.PlainText)
+        self._processing_text.prepare(font=self._processing_font)
+        self._processing_text_height = QFontMetricsF(self._processing_font).height()
+        self._timer_key = None
+        # Dirty rects for partial repaints while recording
+        self._waveform_rect = QRect()
+        self._timer_rect = QRect()
         
         self._setup_window()
         self._setup_timers()
         self._setup_animations()
         self._setup_context_menu()
         self._position_window()
+        self._recompute_layout()
+        self._update_mask()
         
         # Enable mouse tracking for hover
         self.setMouseTracking(True)
@@ -77,6 +130,7 @@ class OverlayIndicator(QWidget):
         self._current_width = value
         self.setFixedSize(int(self._current_width), int(self._current_height))
         self._position_window()
+        self._recompute_layout()
         self.update()
     
     @pyqtProperty(float)
@@ -88,6 +142,7 @@ class OverlayIndicator(QWidget):
         self._current_height = value
         self.setFixedSize(int(self._current_width), int(self._current_height))
         self._position_window()
+        self._recompute_layout()
         self.update()
     
     def _setup_window(self):
@@ -102,23 +157,24 @@ class OverlayIndicator(QWidget):
         self.setFixedSize(int(self._current_width), int(self._current_height))
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+        
+        # Cache the work area; refresh only when screens change
+        self._screen = None
+        self._screen_geom = None
+        self._last_pos = None
+        app = QApplication.instance()
+        app.primaryScreenChanged.connect(self._on_screens_changed)
+        app.screenAdded.connect(self._on_screens_changed)
+        app.screenRemoved.connect(self._on_screens_changed)
+        self._watch_primary_screen()
     
     def _setup_timers(self):
         """Setup animation timers."""
-        # Timer update (every 100ms)
-        self._timer_update = QTimer(self)
-        self._timer_update.timeout.connect(self._update_timer)
-        self._timer_update.setInterval(100)
-        
-        # Waveform animation (30 FPS)
-        self._waveform_timer = QTimer(self)
-        self._waveform_timer.timeout.connect(self._update_waveform)
-        self._waveform_timer.setInterval(33)
-        
-        # Pulse animation for processing state
-        self._pulse_timer = QTimer(self)
-        self._pulse_timer.timeout.connect(self._update_pulse)
-        self._pulse_timer.setInterval(50)
+        # One ~30 FPS tick drives the waveform, timer text and pulse
+        self._tick = QTimer(self)
+        self._tick.timeout.connect(self._on_tick)
+        self._tick.setInterval(33)
+        self._tick_count = 0
         
         # Hover shake animation
         self._shake_timer = QTimer(self)
@@ -126,11 +182,10 @@ class OverlayIndicator(QWidget):
         self._shake_timer.setInterval(30)
         self._shake_frame = 0
         
-        # Always-on-top enforcement timer (every 500ms)
+        # Always-on-top enforcement timer (every 500ms, while shown)
         self._topmost_timer = QTimer(self)
         self._topmost_timer.timeout.connect(self._enforce_topmost)
         self._topmost_timer.setInterval(500)
-        self._topmost_timer.start()
     
     def _setup_animations(self):
         """Setup size transition animations."""
@@ -143,6 +198,10 @@ class OverlayIndicator(QWidget):
         self._height_anim = QPropertyAnimation(self, b"animatedHeight")
         self._height_anim.setDuration(200)  # 200ms
         self._height_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        
+        # The mask is left off while resizing and rebuilt once at the end
+        self._width_anim.finished.connect(self._on_size_anim_finished)
+        self._height_anim.finished.connect(self._on_size_anim_finished)
     
     def _setup_context_menu(self):
         """Setup right-click context menu."""
@@ -197,6 +256,7 @@ class OverlayIndicator(QWidget):
             self._height_anim.setStartValue(self._current_height)
             self._height_anim.setEndValue(target_height)
             
+            self.clearMask()
             self._width_anim.start()
             self._height_anim.start()
         else:
@@ -205,14 +265,91 @@ class OverlayIndicator(QWidget):
             self._current_height = target_height
             self.setFixedSize(int(self._current_width), int(self._current_height))
             self._position_window()
+            self._recompute_layout()
+            self._update_mask()
+    
+    def _on_size_anim_finished(self):
+        """Restore the pill mask once both size animations have ended."""
+        if self._is_resizing():
+            return
+        self._update_mask()
+    
+    def _is_resizing(self) -> bool:
+        """Whether a size transition is still running."""
+        running = QPropertyAnimation.State.Running
+        return self._width_anim.state() == running or self._height_anim.state() == running
+    
+    def _recompute_layout(self):
+        """Recompute size-dependent geometry (mic, waveform, timer, dirty rects)."""
+        w = self._current_width
+        h = self._current_height
+        mic_size = h - self.MIC_MARGIN * 2
+        self._mic_rect = QRectF(self.MIC_MARGIN, self.MIC_MARGIN, mic_size, mic_size)
+        self._center_y = h / 2
+        self._bar_scale = h * 0.5
+        self._timer_pos = QPointF(w - 40, 0)
+        
+        # Waveform bar x positions; bars that would overflow are dropped
+        start = self.MIC_MARGIN + mic_size + 8
+        end = w - 42
+        bar_count = self.WAVEFORM_BARS
+        bar_width = self.BAR_WIDTH
+        bar_spacing = max(1, (end - start - bar_count * bar_width) / max(1, bar_count - 1))
+        xs = start + np.arange(bar_count) * (bar_width + bar_spacing)
+        self._bar_xs = xs[xs + bar_width <= end].tolist()
+        fit = len(self._bar_xs)
+        # Row i lists buffer indices oldest-first when the head is at i
+        self._ring_order = (np.arange(bar_count)[:, None] + np.arange(fit)) % bar_count
+        self._bar_heights = np.empty(fit)
+        self._bar_ys = np.empty(fit)
+        
+        # Dirty rects for partial repaints while recording
+        ih = int(math.ceil(h))
+        left = int(start) - 1
+        right = int(math.ceil(end)) + 1
+        self._waveform_rect = QRect(left, 0, max(0, right - left), ih)
+        self._timer_rect = QRect(int(w) - 41, 0, 39, ih)
+        self._icon_rect = self._mic_rect.toAlignedRect().adjusted(-1, -1, 1, 1)
+    
+    def _update_mask(self):
+        """Limit hit-testing to the pill so its transparent corners pass clicks through."""
+        if self._is_hovered or self._is_resizing():
+            # The hover zoom draws past the pill outline, and mid-animation
+            # sizes are not worth a mask each frame
+            self.clearMask()
+            return
+        w = self._current_width
+        h = self._current_height
+        # One pixel of slack keeps the antialiased edge unclipped
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(-1, -1, w + 2, h + 2), h / 2 + 1, h / 2 + 1)
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+    
+    def _watch_primary_screen(self):
+        """Track the primary screen and cache its available geometry."""
+        screen = QApplication.primaryScreen()
+        if screen is not self._screen:
+            if self._screen is not None:
+                try:
+                    self._screen.availableGeometryChanged.disconnect(self._on_screens_changed)
+                except TypeError:
+                    pass
+            if screen is not None:
+                screen.availableGeometryChanged.connect(self._on_screens_changed)
+            self._screen = screen
+        self._screen_geom = screen.availableGeometry() if screen else None
+    
+    def _on_screens_changed(self, *args):
+        """Refresh the cached work area and reposition."""
+        self._watch_primary_screen()
+        self._position_window()
     
     def _position_window(self):
         """Position window based on configured position."""
-        screen = QApplication.primaryScreen()
-        if not screen:
+        geometry = self._screen_geom
+        if geometry is None:
             return
         
-        geometry = screen.availableGeometry()
         w = int(self._current_width)
         h = int(self._current_height)
         m = self.MARGIN
@@ -237,7 +374,15 @@ class OverlayIndicator(QWidget):
             x = geometry.right() - w - m
             y = geometry.bottom() - h - m
         
-        self.move(x, y)
+        # Size animations often leave the position unchanged
+        if (x, y) != self._last_pos:
+            self._last_pos = (x, y)
+            self.move(x, y)
+    
+    @property
+    def position(self) -> str:
+        """Current overlay position key."""
+        return self._position
     
     def set_position(self, position: str):
         """Set overlay position."""
@@ -245,30 +390,57 @@ class OverlayIndicator(QWidget):
             self._position = position
             self._position_window()
     
+    def _on_tick(self):
+        """Advance the animations of the current state."""
+        if self.visibleRegion().isEmpty():
+            return
+        self._tick_count += 1
+        if self._state == "recording":
+            self._update_waveform()
+            if self._tick_count % 3 == 0:  # ~100 ms
+                self._update_timer()
+        elif self._state == "processing":
+            if self._tick_count % 2 == 0:  # ~66 ms
+                self._update_pulse()
+    
     def _update_timer(self):
-        """Update recording timer display."""
-        self.update()
+        """Update recording timer display when the shown text changes."""
+        time_str = self._get_recording_time()
+        if time_str != self._time_str:
+            self._time_str = time_str
+            self.update(self._timer_rect)
     
     def _update_waveform(self):
         """Update waveform animation."""
-        # Shift waveform data left and add new random value
-        self._audio_levels = self._audio_levels[1:] + [random.uniform(0.1, 0.8)]
-        self.update()
+        level = self._pending_level
+        if level < 0:
+            # No real level since the last tick
+            level = random.uniform(0.1, 0.8)
+        else:
+            self._pending_level = -1.0
+        self._push_level(level)
+        self.update(self._waveform_rect)
+    
+    def _push_level(self, level: float):
+        """Overwrite the oldest waveform sample with a new one."""
+        head = self._level_head
+        self._audio_levels[head] = level
+        self._level_head = (head + 1) % self.WAVEFORM_BARS
     
     def _update_pulse(self):
         """Update pulse animation for processing."""
-        self._pulse_opacity += self._pulse_direction * 0.05
-        if self._pulse_opacity <= 0.4:
-            self._pulse_opacity = 0.4
+        self._pulse_level += self._pulse_direction
+        if self._pulse_level <= 0:
+            self._pulse_level = 0
             self._pulse_direction = 1
-        elif self._pulse_opacity >= 1.0:
-            self._pulse_opacity = 1.0
+        elif self._pulse_level >= len(self.PULSE_COLORS) - 1:
+            self._pulse_level = len(self.PULSE_COLORS) - 1
             self._pulse_direction = -1
-        self.update()
+        # Only the circle and dots change with the pulse
+        self.update(self._icon_rect)
     
     def _update_shake(self):
         """Update hover shake animation."""
-        import math
         self._shake_frame += 1
         
         # Shake pattern: quick wiggle that settles
@@ -291,10 +463,25 @@ class OverlayIndicator(QWidget):
         if self.isVisible():
             self.raise_()
     
+    def showEvent(self, event):
+        """Resume timers when the overlay is shown."""
+        self._topmost_timer.start()
+        if self._state != "idle":
+            self._tick.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Stop all timers while the overlay is hidden."""
+        self._topmost_timer.stop()
+        self._tick.stop()
+        self._shake_timer.stop()
+        super().hideEvent(event)
+    
     def enterEvent(self, event):
         """Handle mouse enter - start hover animation."""
         if self._state == "idle":
             self._is_hovered = True
+            self._update_mask()
             self._shake_frame = 0
             self._shake_timer.start()
         super().enterEvent(event)
@@ -302,6 +489,7 @@ class OverlayIndicator(QWidget):
     def leaveEvent(self, event):
         """Handle mouse leave - reset hover state."""
         self._is_hovered = False
+        self._update_mask()
         self._shake_timer.stop()
         self._hover_scale = 1.0
         self._shake_offset = 0
@@ -310,51 +498,50 @@ class OverlayIndicator(QWidget):
     
     def set_audio_level(self, level: float):
         """Update audio level for waveform (0.0 to 1.0)."""
-        # Add real audio level to waveform
-        self._audio_levels = self._audio_levels[1:] + [max(0.1, min(1.0, level))]
+        # Held until the next tick; keep the peak so bursts are not lost
+        level = max(0.1, min(1.0, level))
+        if level > self._pending_level:
+            self._pending_level = level
     
     def set_state(self, state: str):
         """Set indicator state: 'idle', 'recording', or 'processing'."""
-        # print(f"[Overlay] set_state: {self._state} -> {state}", flush=True)
         if self._state == state:
-            # print(f"[Overlay] State unchanged, skipping", flush=True)
             return
         
+        logger.debug("[Overlay] set_state: %s -> %s", self._state, state)
         self._state = state
-        target_w = self.IDLE_WIDTH if state == "idle" else self.RECORDING_WIDTH
-        target_h = self.IDLE_HEIGHT if state == "idle" else self.RECORDING_HEIGHT
-        # print(f"[Overlay] Target size: {target_w}x{target_h}", flush=True)
         self._update_size()
         
         if state == "recording":
-            self._recording_start_time = time.time()
-            self._audio_levels = [0.1] * 40  # Reset waveform
-            self._timer_update.start()
-            self._waveform_timer.start()
-            self._pulse_timer.stop()
+            self._recording_clock.start()
+            self._time_str = "0:00"
+            self._audio_levels.fill(0.1)  # Reset waveform
+            self._level_head = 0
+            self._pending_level = -1.0
+            self._tick_count = 0
+            if self.isVisible():  # Otherwise showEvent starts it
+                self._tick.start()
         elif state == "processing":
-            self._timer_update.stop()
-            self._waveform_timer.stop()
-            self._pulse_timer.start()
+            self._tick_count = 0
+            if self.isVisible():
+                self._tick.start()
         else:  # idle
-            self._timer_update.stop()
-            self._waveform_timer.stop()
-            self._pulse_timer.stop()
-            self._pulse_opacity = 1.0
+            self._tick.stop()
+            self._pulse_level = len(self.PULSE_COLORS) - 1
         
         self.update()
     
     def _get_recording_time(self) -> str:
         """Get formatted recording time."""
-        if self._recording_start_time == 0:
+        if not self._recording_clock.isValid():
             return "0:00"
-        elapsed = int(time.time() - self._recording_start_time)
+        elapsed = self._recording_clock.elapsed() // 1000
         minutes = elapsed // 60
         seconds = elapsed % 60
         return f"{minutes}:{seconds:02d}"
     
     def paintEvent(self, event):
-        """Draw the indicator."""
+        """Draw the indicator (clipped to the invalidated region)."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
@@ -365,65 +552,102 @@ class OverlayIndicator(QWidget):
         elif self._state == "processing":
             self._draw_processing(painter)
     
+    def _draw_bg(self, painter: QPainter):
+        """Draw the pill background with the current brush and pen."""
+        w, h = self._current_width, self._current_height
+        rect = self._bg_rect
+        if rect.width() != w or rect.height() != h:
+            rect.setRect(0, 0, w, h)
+        painter.drawRoundedRect(rect, h / 2, h / 2)
+    
     def _draw_idle(self, painter: QPainter):
         """Draw idle state - small pill with dot."""
+        w = self._current_width
+        h = self._current_height
+        
         # Apply hover transformation
         if self._is_hovered and self._hover_scale != 1.0:
-            center_x = self._current_width / 2
-            center_y = self._current_height / 2
+            center_x = w / 2
+            center_y = h / 2
             painter.translate(center_x + self._shake_offset, center_y)
             painter.scale(self._hover_scale, self._hover_scale)
             painter.translate(-center_x, -center_y)
         
         # Draw pill background
-        path = QPainterPath()
-        rect = QRectF(0, 0, self._current_width, self._current_height)
-        path.addRoundedRect(rect, self._current_height / 2, self._current_height / 2)
-        
-        painter.setBrush(QBrush(self.BG_COLOR))
+        painter.setBrush(self.BG_BRUSH)
         
         # Always show bright border (brighter on hover)
         if self._is_hovered:
-            painter.setPen(QPen(QColor(150, 150, 170), 1))  # Brighter on hover
+            painter.setPen(self.HOVER_BORDER_PEN)  # Brighter on hover
         else:
-            painter.setPen(QPen(QColor(80, 80, 100), 1))  # Normal border
+            painter.setPen(self.BORDER_PEN)  # Normal border
         
-        painter.drawPath(path)
+        self._draw_bg(painter)
         
         # Draw center dot
         dot_size = 6
-        dot_x = (self._current_width - dot_size) / 2
-        dot_y = (self._current_height - dot_size) / 2
-        painter.setBrush(QBrush(self.IDLE_DOT_COLOR))
+        dot_x = (w - dot_size) / 2
+        dot_y = (h - dot_size) / 2
+        painter.setBrush(self.IDLE_DOT_BRUSH)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(QRectF(dot_x, dot_y, dot_size, dot_size))
     
-    def _draw_recording(self, painter: QPainter):
-        """Draw recording state - pill with mic, waveform, timer."""
+    def _render_pixmap(self, draw, *args) -> QPixmap:
+        """Render draw(painter, *args) into a transparent widget-sized pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(
+            math.ceil(self._current_width * dpr),
+            math.ceil(self._current_height * dpr),
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        draw(painter, *args)
+        painter.end()
+        return pixmap
+    
+    def _get_static_pixmap(self) -> QPixmap:
+        """Pill background and mic for the recording state, cached per size."""
+        key = (self._current_width, self._current_height, self.devicePixelRatioF())
+        if self._static_pixmap is None or self._static_key != key:
+            self._static_pixmap = self._render_pixmap(self._draw_recording_static)
+            self._static_key = key
+        return self._static_pixmap
+    
+    def _get_processing_pixmap(self) -> QPixmap:
+        """Processing frame for the current pulse level, cached per size."""
+        key = (self._current_width, self._current_height, self.devicePixelRatioF())
+        if self._processing_key != key:
+            self._processing_pixmaps.clear()
+            self._processing_key = key
+        level = self._pulse_level
+        pixmap = self._processing_pixmaps.get(level)
+        if pixmap is None:
+            pixmap = self._render_pixmap(self._draw_processing_frame, self.PULSE_COLORS[level])
+            self._processing_pixmaps[level] = pixmap
+        return pixmap
+    
+    def _draw_recording_static(self, painter: QPainter):
+        """Draw the parts of the recording state that only depend on size."""
         # Draw pill background
-        path = QPainterPath()
-        rect = QRectF(0, 0, self._current_width, self._current_height)
-        path.addRoundedRect(rect, self._current_height / 2, self._current_height / 2)
-        
-        painter.setBrush(QBrush(self.BG_COLOR))
-        painter.setPen(QPen(QColor(80, 80, 100), 1))  # Border
-        painter.drawPath(path)
+        painter.setBrush(self.BG_BRUSH)
+        painter.setPen(self.BORDER_PEN)  # Border
+        self._draw_bg(painter)
         
         # Draw microphone icon with red background
-        mic_margin = 4
-        mic_size = self._current_height - mic_margin * 2
-        mic_x = mic_margin
-        mic_y = mic_margin
+        mic_rect = self._mic_rect
+        mic_size = mic_rect.width()
         
         # Red circle background
-        painter.setBrush(QBrush(self.MIC_BG_COLOR))
-        painter.drawEllipse(QRectF(mic_x, mic_y, mic_size, mic_size))
+        painter.setBrush(self.MIC_BG_BRUSH)
+        painter.drawEllipse(mic_rect)
         
         # Microphone icon (simplified)
-        painter.setPen(QPen(self.MIC_ICON_COLOR, 1.5))
+        painter.setPen(self.MIC_ICON_PEN)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        mic_center_x = mic_x + mic_size / 2
-        mic_center_y = mic_y + mic_size / 2
+        mic_center_x = mic_rect.center().x()
+        mic_center_y = mic_rect.center().y()
         
         # Mic body (rounded rectangle)
         mic_body_w = mic_size * 0.28
@@ -450,67 +674,85 @@ class OverlayIndicator(QWidget):
             QPointF(mic_center_x, mic_center_y + mic_size * 0.22),
             QPointF(mic_center_x, mic_center_y + mic_size * 0.32)
         )
+    
+    def _draw_recording(self, painter: QPainter):
+        """Draw recording state - pill with mic, waveform, timer."""
+        # Static pill and mic come from a cached pixmap
+        painter.drawPixmap(0, 0, self._get_static_pixmap())
         
-        # Draw waveform
-        waveform_start = mic_x + mic_size + 8
-        waveform_end = self._current_width - 42
-        waveform_width = waveform_end - waveform_start
-        bar_count = len(self._audio_levels)
-        bar_width = 2
-        bar_spacing = max(1, (waveform_width - bar_count * bar_width) / max(1, bar_count - 1))
-        
+        # Draw waveform (bar x positions are precomputed per size)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(self.WAVEFORM_COLOR))
-        
-        center_y = self._current_height / 2
-        max_bar_height = self._current_height * 0.5
-        
-        for i, level in enumerate(self._audio_levels):
-            bar_height = max(2, level * max_bar_height)
-            bar_x = waveform_start + i * (bar_width + bar_spacing)
-            if bar_x + bar_width > waveform_end:
-                break
-            bar_y = center_y - bar_height / 2
-            painter.drawRoundedRect(QRectF(bar_x, bar_y, bar_width, bar_height), 1, 1)
-        
-        # Draw timer
-        painter.setPen(QPen(self.TIMER_COLOR))
-        font = QFont("SF Pro", 11)
-        font.setWeight(QFont.Weight.Medium)
-        painter.setFont(font)
-        
-        time_str = self._get_recording_time()
-        timer_rect = QRectF(self._current_width - 40, 0, 36, self._current_height)
-        painter.drawText(timer_rect, Qt.AlignmentFlag.AlignCenter, time_str)
+        painter.setBrush(self.WAVEFORM_BRUSH)
+        
+        heights, ys = self._layout_bars()
+        bar_width = self.BAR_WIDTH
+        painter.drawRects([
+            QRectF(x, y, bar_width, bar_h)
+            for x, y, bar_h in zip(self._bar_xs, ys.tolist(), heights.tolist())
+        ])
+        
+        # Draw timer (text changes once per second, so reuse its pixmap)
+        painter.drawPixmap(self._timer_pos, self._get_timer_pixmap())
+    
+    def _layout_bars(self):
+        """Fill the preallocated bar height / y arrays, oldest sample first."""
+        heights = self._bar_heights
+        ys = self._bar_ys
+        # Gather the ring buffer in chronological order without a temporary
+        np.take(self._audio_levels, self._ring_order[self._level_head], out=heights)
+        np.multiply(heights, self._bar_scale, out=heights)
+        np.maximum(heights, 2.0, out=heights)
+        np.multiply(heights, -0.5, out=ys)
+        np.add(ys, self._center_y, out=ys)
+        return heights, ys
+    
+    def _get_timer_pixmap(self) -> QPixmap:
+        """Rendered timer text, rebuilt when the text or height changes."""
+        time_str = self._time_str
+        h = self._current_height
+        dpr = self.devicePixelRatioF()
+        key = (time_str, h, dpr)
+        if self._timer_key != key:
+            pixmap = QPixmap(math.ceil(36 * dpr), math.ceil(h * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(self.TIMER_PEN)
+            painter.setFont(self._timer_font)
+            painter.drawText(
+                QRectF(0, 0, 36, h), Qt.AlignmentFlag.AlignCenter, time_str
+            )
+            painter.end()
+            self._timer_pixmap = pixmap
+            self._timer_key = key
+        return self._timer_pixmap
     
     def _draw_processing(self, painter: QPainter):
+        """Draw processing state from the cached frame for the pulse step."""
+        painter.drawPixmap(0, 0, self._get_processing_pixmap())
+    
+    def _draw_processing_frame(self, painter: QPainter, color: QColor):
         """Draw processing state - similar to recording but orange."""
-        # Draw pill background
-        path = QPainterPath()
-        rect = QRectF(0, 0, self._current_width, self._current_height)
-        path.addRoundedRect(rect, self._current_height / 2, self._current_height / 2)
+        h = self._current_height
         
-        painter.setBrush(QBrush(self.BG_COLOR))
-        painter.setPen(QPen(QColor(80, 80, 100), 1))  # Border
-        painter.drawPath(path)
+        # Draw pill background
+        painter.setBrush(self.BG_BRUSH)
+        painter.setPen(self.BORDER_PEN)  # Border
+        self._draw_bg(painter)
         
         # Draw processing icon with orange background (pulsing)
-        mic_margin = 4
-        mic_size = self._current_height - mic_margin * 2
-        mic_x = mic_margin
-        mic_y = mic_margin
+        mic_rect = self._mic_rect
         
         # Orange circle background with pulse
-        color = QColor(self.PROCESSING_COLOR)
-        color.setAlphaF(self._pulse_opacity)
         painter.setBrush(QBrush(color))
-        painter.drawEllipse(QRectF(mic_x, mic_y, mic_size, mic_size))
+        painter.drawEllipse(mic_rect)
         
         # Processing dots (animated)
-        painter.setBrush(QBrush(self.MIC_ICON_COLOR))
+        painter.setBrush(self.MIC_ICON_BRUSH)
         dot_size = 3
-        mic_center_x = mic_x + mic_size / 2
-        mic_center_y = mic_y + mic_size / 2
+        mic_center_x = mic_rect.center().x()
+        mic_center_y = mic_rect.center().y()
         spacing = 5
         
         for i in range(3):
@@ -521,13 +763,13 @@ class OverlayIndicator(QWidget):
                 dot_size, dot_size
             ))
         
-        # Draw shorter text "処理中"
-        painter.setPen(QPen(self.TIMER_COLOR))
-        font = QFont("Yu Gothic UI", 10)
-        painter.setFont(font)
-        
-        text_rect = QRectF(mic_x + mic_size + 6, 0, self._current_width - mic_size - 14, self._current_height)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, "処理中")
+        # Draw shorter text "処理中" (layout prepared once), centered vertically
+        painter.setPen(self.TIMER_PEN)
+        painter.setFont(self._processing_font)
+        painter.drawStaticText(
+            QPointF(mic_rect.right() + 6, (h - self._processing_text_height) / 2),
+            self._processing_text,
+        )
     
     def show_indicator(self):
         """Show the overlay."""
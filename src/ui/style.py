@@ -0,0 +1,244 @@
+"""Application-wide Qt palette and stylesheet for Chotto Voice."""
+from PyQt6.QtGui import QColor, QPalette
+
+
+def create_app_palette() -> QPalette:
+    """Create the base palette (window and text colors).
+    
+    Plain colors live here rather than in APP_QSS so the native style can
+    use them without a stylesheet rule.
+    """
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor("#ffffff"))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor("#212529"))
+    palette.setColor(QPalette.ColorRole.Base, QColor("#ffffff"))
+    palette.setColor(QPalette.ColorRole.Text, QColor("#212529"))
+    return palette
+
+
+# Applied once on the QApplication; widgets are matched by class and
+# objectName, so individual windows do not need their own setStyleSheet
+APP_QSS = """
+    QWidget#sidebar {
+        background-color: #f8f9fa;
+        border-right: 1px solid #e9ecef;
+    }
+    QListWidget {
+        background-color: transparent;
+        border: none;
+        font-size: 13px;
+        outline: none;
+    }
+    QListWidget::item {
+        padding: 12px 16px;
+        border-radius: 6px;
+        margin: 2px 8px;
+        color: #495057;
+    }
+    QListWidget::item:selected {
+        background-color: #e7f1ff;
+        color: #1971c2;
+    }
+    QListWidget::item:hover:!selected {
+        background-color: #f1f3f4;
+    }
+    QLabel#appTitle {
+        font-size: 16px;
+        font-weight: 600;
+        color: #212529;
+        padding: 16px;
+    }
+    QLabel#pageTitle {
+        font-size: 18px;
+        font-weight: 600;
+        color: #212529;
+        padding-bottom: 8px;
+    }
+    QLabel#sectionTitle {
+        font-size: 13px;
+        font-weight: 600;
+        color: #495057;
+        padding-top: 16px;
+        padding-bottom: 4px;
+    }
+    QLabel#hint {
+        font-size: 12px;
+        color: #868e96;
+    }
+    QLabel#statusLabel {
+        font-size: 12px;
+        color: #868e96;
+    }
+    QLabel#statusLabel[level="recording"] {
+        color: red;
+        font-weight: bold;
+    }
+    QLabel#statusLabel[level="error"] {
+        color: red;
+    }
+    QLabel#statusLabel[level="success"] {
+        color: green;
+    }
+    QLabel#statusLabel[level="warning"] {
+        color: orange;
+    }
+    QLabel#statusLabel[level="info"] {
+        color: gray;
+    }
+    QLabel#settingLabel {
+        font-size: 13px;
+        color: #212529;
+    }
+    QLineEdit {
+        padding: 8px 12px;
+        border: 1px solid #dee2e6;
+        border-radius: 6px;
+        background: #ffffff;
+        font-size: 13px;
+        min-height: 18px;
+        color: #212529;
+    }
+    QLineEdit:focus {
+        border-color: #74c0fc;
+        outline: none;
+    }
+    QComboBox {
+        padding: 8px 12px;
+        border: 1px solid #dee2e6;
+        border-radius: 6px;
+        background: #ffffff;
+        font-size: 13px;
+        min-height: 18px;
+        color: #212529;
+    }
+    QComboBox:focus {
+        border-color: #74c0fc;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+        subcontrol-position: right center;
+        subcontrol-origin: padding;
+    }
+    QComboBox::down-arrow {
+        width: 0;
+        height: 0;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 6px solid #868e96;
+    }
+    QComboBox:disabled {
+        background: #f1f3f5;
+        color: #adb5bd;
+    }
+    QWidget#posGrid {
+        background: #343a40;
+        border-radius: 8px;
+        border: 2px solid #495057;
+    }
+    QPushButton#posBtn {
+        border: none;
+        border-radius: 3px;
+        background: transparent;
+        font-size: 10px;
+        color: #6c757d;
+        padding: 2px;
+    }
+    QPushButton#posBtn:hover {
+        background: rgba(255, 255, 255, 0.1);
+        color: #adb5bd;
+    }
+    QPushButton#posBtn:checked {
+        background: transparent;
+        color: #228be6;
+        font-size: 12px;
+    }
+    QLineEdit#hotkeyInput {
+        padding: 10px 14px;
+        border: 2px solid #dee2e6;
+        border-radius: 8px;
+        background: #ffffff;
+        font-size: 14px;
+        font-weight: 500;
+        color: #212529;
+    }
+    QLineEdit#hotkeyInput:focus {
+        border-color: #228be6;
+        background: #f8f9fa;
+    }
+    QComboBox QAbstractItemView {
+        background-color: white;
+        border: 1px solid #dee2e6;
+        selection-background-color: #e7f1ff;
+        selection-color: #212529;
+        color: #212529;
+        outline: none;
+        padding: 4px;
+    }
+    QComboBox QAbstractItemView::item {
+        padding: 6px 12px;
+        min-height: 24px;
+        color: #212529;
+        background-color: white;
+    }
+    QComboBox QAbstractItemView::item:selected {
+        background-color: #e7f1ff;
+        color: #212529;
+    }
+    QPlainTextEdit {
+        border: 1px solid #dee2e6;
+        border-radius: 6px;
+        background: #ffffff;
+        font-size: 13px;
+        padding: 8px;
+    }
+    QCheckBox {
+        font-size: 13px;
+        color: #212529;
+        spacing: 10px;
+        padding: 4px 0;
+    }
+    QCheckBox::indicator {
+        width: 40px;
+        height: 22px;
+        border-radius: 11px;
+        border: none;
+        background: #ced4da;
+    }
+    QCheckBox::indicator:checked {
+        background: #228be6;
+    }
+    QPushButton#primary {
+        background-color: #228be6;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    QPushButton#primary:hover {
+        background-color: #1c7ed6;
+    }
+    QPushButton#secondary {
+        background-color: #f8f9fa;
+        color: #495057;
+        border: 1px solid #dee2e6;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 13px;
+    }
+    QPushButton#secondary:hover {
+        background-color: #e9ecef;
+    }
+    QProgressBar {
+        border: none;
+        background: #e9ecef;
+        border-radius: 2px;
+        max-height: 4px;
+    }
+    QProgressBar::chunk {
+        background: #228be6;
+        border-radius: 2px;
+    }
+"""
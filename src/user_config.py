@@ -4,35 +4,43 @@ Persists user settings (hotkey, startup options) to a JSON file.
 Settings are stored in the user's config directory.
 """
 import json
+import os
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
+try:
+    import orjson  # Optional: faster settings load/save
+except ImportError:
+    orjson = None
 
+
+# Home directory and per-platform config base, resolved once at import
+_HOME = Path.home()
+_CONFIG_BASE = {
+    "win32": _HOME / "AppData" / "Roaming",  # Windows: %APPDATA%/ChottoVoice
+    "darwin": _HOME / "Library" / "Application Support",  # macOS
+}.get(sys.platform, _HOME / ".config")  # Linux: ~/.config/ChottoVoice
+
+
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get the configuration directory for the current platform."""
-    if sys.platform == "win32":
-        # Windows: %APPDATA%/ChottoVoice
-        base = Path.home() / "AppData" / "Roaming"
-    elif sys.platform == "darwin":
-        # macOS: ~/Library/Application Support/ChottoVoice
-        base = Path.home() / "Library" / "Application Support"
-    else:
-        # Linux: ~/.config/ChottoVoice
-        base = Path.home() / ".config"
-    
-    config_dir = base / "ChottoVoice"
+    """Get the configuration directory for the current platform (created once)."""
+    config_dir = _CONFIG_BASE / "ChottoVoice"
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the path to the user config file."""
     return get_config_dir() / "settings.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserConfig:
     """User-configurable settings that persist across sessions."""
     
@@ -65,73 +73,161 @@ class UserConfig:
     # First run flag
     first_run_complete: bool = False
     
+    # Save coalescing state (not persisted; declared so it gets a slot)
+    _save_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _save_timer: Optional[threading.Timer] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Serializes _write between the timer thread and sync()
+    _write_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    
+    # Seconds to wait so a burst of save() calls produces one write
+    SAVE_DELAY = 0.2
+    
     @classmethod
     def load(cls) -> "UserConfig":
         """Load config from file, or return defaults."""
-        config_path = get_config_path()
+        try:
+            raw = get_config_path().read_bytes()
+        except FileNotFoundError:
+            return cls()
         
-        if config_path.exists():
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
-            except (json.JSONDecodeError, TypeError) as e:
-                print(f"Config load error: {e}, using defaults")
+        try:
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            # Ignore unknown (e.g. removed) keys left in older settings files
+            return cls(**{k: data[k] for k in data.keys() & _ALLOWED_KEYS})
+        except (json.JSONDecodeError, TypeError) as e:
+            print(f"Config load error: {e}, using defaults")
         
         return cls()
     
     def save(self):
-        """Save config to file."""
-        config_path = get_config_path()
-        
-        try:
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(asdict(self), f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Config save error: {e}")
+        """Schedule a save; calls within SAVE_DELAY are coalesced into one write."""
+        with self._save_lock:
+            if self._save_timer is None:
+                # Non-daemon, so a pending write still happens at interpreter exit
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush)
+                self._save_timer.start()
+    
+    def _flush(self):
+        """Perform a scheduled save."""
+        with self._save_lock:
+            self._save_timer = None
+        self._write(durable=False)
+    
+    def sync(self):
+        """Save config now and fsync it so the write survives a crash."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._write(durable=True)
+    
+    def _write(self, durable: bool):
+        """Atomically write config JSON, optionally forcing it to disk."""
+        # A timer flush already in progress can race sync(); hold the lock for
+        # the whole write so the newest snapshot always lands last and the two
+        # never share the temp file.
+        with self._write_lock:
+            config_path = get_config_path()
+            
+            # Fields are flat scalars, so a shallow dict is enough (no asdict deep copy)
+            data = {name: getattr(self, name) for name in _FIELD_NAMES}
+            if orjson:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+            
+            # Write to a sibling file and swap it in so a crash mid-write never
+            # leaves a truncated settings.json behind.
+            tmp_path = config_path.with_suffix(".json.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, config_path)
+            except Exception as e:
+                print(f"Config save error: {e}")
     
     def update(self, **kwargs):
-        """Update specific fields and save."""
+        """Update specific fields and save if any of them changed."""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if hasattr(self, key) and getattr(self, key) != value:
                 setattr(self, key, value)
-        self.save()
+                changed = True
+        if changed:
+            self.save()
 
 
+# Persisted field names, in declaration order
+_FIELD_NAMES = tuple(f.name for f in fields(UserConfig) if f.init)
+_ALLOWED_KEYS = frozenset(_FIELD_NAMES)
+
+
+@lru_cache(maxsize=1)
 def get_startup_folder() -> Optional[Path]:
     """Get the Windows Startup folder path."""
     if sys.platform != "win32":
         return None
     
-    # Windows Startup folder: shell:startup
-    startup = Path.home() / "AppData" / "Roaming" / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
+    # Windows Startup folder: shell:startup (under %APPDATA%)
+    startup = _CONFIG_BASE / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
     return startup if startup.exists() else None
 
 
+# Startup entries: the .lnk shortcut, or the .bat fallback without pywin32
+_SHORTCUT_NAME = "Chotto Voice.lnk"
+_BAT_NAME = "Chotto Voice.bat"
+
+
+@lru_cache(maxsize=1)
 def get_shortcut_path() -> Optional[Path]:
     """Get the path to the startup shortcut."""
     startup = get_startup_folder()
     if startup:
-        return startup / "Chotto Voice.lnk"
+        return startup / _SHORTCUT_NAME
     return None
 
 
+def _find_startup_entries() -> list[Path]:
+    """Return our startup entries present in the Startup folder (one scandir)."""
+    startup = get_startup_folder()
+    if not startup:
+        return []
+    with os.scandir(startup) as it:
+        return [Path(e.path) for e in it if e.name in (_SHORTCUT_NAME, _BAT_NAME)]
+
+
 def is_startup_enabled() -> bool:
-    """Check if Windows startup is enabled."""
-    shortcut = get_shortcut_path()
-    if not shortcut:
-        return False
-    
-    # Check for .lnk shortcut
-    if shortcut.exists():
-        return True
+    """Check the Startup folder for our shortcut or .bat fallback.
     
-    # Check for .bat fallback
-    bat_path = shortcut.with_suffix(".bat")
-    if bat_path.exists():
-        return True
-    
-    return False
+    The UI shows the persisted UserConfig.start_with_windows instead; call
+    this only when the on-disk state must be re-checked.
+    """
+    try:
+        return bool(_find_startup_entries())
+    except OSError:
+        return False
+
+
+# Project root and script used when running from source
+_APP_DIR = Path(__file__).parent.parent
+_MAIN_SCRIPT = _APP_DIR / "main.py"
+
+# WScript.Shell is deliberately not cached: callers (StartupTask) initialize
+# COM only for the duration of one job, and a COM object must not outlive the
+# apartment it was created in, so each call dispatches a fresh handle.
+def _get_wscript_shell():
+    """Dispatch a WScript.Shell in the caller's (initialized) COM apartment."""
+    from win32com.client import Dispatch
+    return Dispatch('WScript.Shell')
 
 
 def enable_startup(exe_path: Optional[str] = None) -> bool:
@@ -152,7 +248,7 @@ def enable_startup(exe_path: Optional[str] = None) -> bool:
     
     try:
         import winshell
-        from win32com.client import Dispatch
+        shell = _get_wscript_shell()
         
         # Determine the target executable
         if exe_path:
@@ -165,20 +261,16 @@ def enable_startup(exe_path: Optional[str] = None) -> bool:
             target = sys.executable
             # For script mode, we need to create a different approach
             # Just point to python.exe with the script as argument
-            script_path = str(Path(__file__).parent.parent / "main.py")
-            
-            shell = Dispatch('WScript.Shell')
             shortcut = shell.CreateShortCut(str(shortcut_path))
             shortcut.Targetpath = target
-            shortcut.Arguments = f'"{script_path}"'
-            shortcut.WorkingDirectory = str(Path(__file__).parent.parent)
+            shortcut.Arguments = f'"{_MAIN_SCRIPT}"'
+            shortcut.WorkingDirectory = str(_APP_DIR)
             shortcut.IconLocation = target
             shortcut.Description = "Chotto Voice - 音声入力アシスタント"
             shortcut.save()
             return True
         
         # For frozen exe
-        shell = Dispatch('WScript.Shell')
         shortcut = shell.CreateShortCut(str(shortcut_path))
         shortcut.Targetpath = target
         shortcut.WorkingDirectory = str(Path(target).parent)
@@ -194,8 +286,7 @@ def enable_startup(exe_path: Optional[str] = None) -> bool:
             if getattr(sys, 'frozen', False):
                 content = f'@echo off\nstart "" "{sys.executable}"'
             else:
-                script_path = Path(__file__).parent.parent / "main.py"
-                content = f'@echo off\ncd /d "{script_path.parent}"\nstart "" pythonw "{script_path}"'
+                content = f'@echo off\ncd /d "{_APP_DIR}"\nstart "" pythonw "{_MAIN_SCRIPT}"'
             
             with open(bat_path, "w") as f:
                 f.write(content)
@@ -214,15 +305,9 @@ def disable_startup() -> bool:
         return False
     
     try:
-        # Remove .lnk shortcut
-        shortcut = get_shortcut_path()
-        if shortcut and shortcut.exists():
-            shortcut.unlink()
-        
-        # Also remove .bat if it exists
-        bat_path = shortcut.with_suffix(".bat") if shortcut else None
-        if bat_path and bat_path.exists():
-            bat_path.unlink()
+        # Remove the .lnk shortcut and/or .bat fallback, whichever exist
+        for path in _find_startup_entries():
+            path.unlink()
         
         return True
     except Exception as e: